@@ -38,3 +38,11 @@ class FITFileHeaderError(ActivityIOError):
 
 class FITMessageHeaderError(ActivityIOError):
     pass
+
+
+class FITCRCError(ActivityIOError):
+    pass
+
+
+class FITCRCWarning(UserWarning):
+    pass
@@ -2,26 +2,39 @@
 # -*- coding: utf-8 -*-
 """
 smart_reader loads, caches, and invokes reader logic for a supplied file path
-based on that files extension. It is provided for convenience, and also forms
-the backbone of the command line interface.
+based on that files extension (or, for files already in memory, on their
+contents). It is provided for convenience, and also forms the backbone of
+the command line interface.
 
 """
 from importlib import import_module
+from os import fsdecode
 from os.path import splitext
+from xml.etree.ElementTree import ParseError, XMLPullParser
 
 from pandas import DataFrame
 
+from activityio._util.sources import is_file_object, is_path
+
 
 MODULE_CACHE = {}
 
+# Enough of the start of a file to tell what format it's in.
+SNIFF_SIZE = 4096
+
+XML_ROOTS = {'gpx': 'gpx', 'pwx': 'pwx', 'TrainingCenterDatabase': 'tcx'}
 
-def smart_reader(file_path, *, vanilla=False, **read_kwargs):
+
+def smart_reader(file_path, *, fmt=None, vanilla=False, **read_kwargs):
     """Dispatch a file reader based on file extension.
 
     Parameters
     ----------
-    file_path : str
-        Path to the file to be read.
+    file_path : str, bytes-like or file object
+        Path to the file to be read, its contents, or a binary file object.
+    fmt : str, optional
+        Format of the file (e.g. 'fit'). By default, this is taken from the
+        extension of a path, or sniffed from the contents of anything else.
     vanilla : bool, optional
         Return a spruced up subclass of the ``pandas.DataFrame``
         (``ActivityData``) and benefit from some extra data pruning and
@@ -38,8 +51,19 @@ def smart_reader(file_path, *, vanilla=False, **read_kwargs):
     ------
     ImportError
         If the file type (based on the extension) is not supported.
+    ValueError
+        If the format of a file in memory can't be recognised.
     """
-    ext = splitext(file_path)[-1][1:]   # drop period from the extension
+    if fmt is not None:
+        ext = fmt
+    elif is_path(file_path):
+        ext = splitext(fsdecode(file_path))[-1][1:]   # drop the period
+    else:
+        if is_file_object(file_path):
+            file_path = file_path.read()   # so it can be sniffed, then read
+        ext = sniff_format(bytes(file_path[:SNIFF_SIZE]))
+        if ext is None:
+            raise ValueError("can't tell what format this file is in")
     ext = ext.lower()  # important
 
     module = MODULE_CACHE.get(ext, None)
@@ -55,3 +79,21 @@ def smart_reader(file_path, *, vanilla=False, **read_kwargs):
         return module.read(file_path, **read_kwargs)
     else:
         return DataFrame.from_records(module.gen_records(file_path))
+
+
+def sniff_format(head):
+    """Format of a file (i.e. the name of its subpackage) from the bytes at
+    the start of it, or None if it isn't recognised."""
+    if head[8:12] == b'.FIT':
+        return 'fit'
+    if head[:3] == b'SRM':
+        return 'srm'
+
+    parser = XMLPullParser(events=('start',))
+    try:
+        parser.feed(head)
+        for __, root in parser.read_events():
+            return XML_ROOTS.get(root.tag.split('}')[-1])   # sans namespace
+    except ParseError:
+        pass
+    return None
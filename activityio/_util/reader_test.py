@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+import os
+
+import pandas as pd
+
+from activityio._util import reader
+
+
+here = os.path.abspath(os.path.dirname(__file__))
+package = os.path.dirname(here)
+samples = [os.path.join(package, fmt, 'test', 'files', name)
+           for fmt, name in (('fit', 'b4ba3c.fit'), ('srm', '71d257.srm'),
+                             ('tcx', 'c2eb1b_2.tcx'))]
+
+
+def test_in_memory():
+    for fp in samples:
+        want = reader.smart_reader(fp)
+        with open(fp, 'rb') as f:
+            contents = f.read()
+        for source in (contents, memoryview(contents), io.BytesIO(contents)):
+            pd.testing.assert_frame_equal(reader.smart_reader(source), want)
+
+        fmt = os.path.splitext(fp)[-1][1:]
+        got = reader.smart_reader(io.BytesIO(contents), fmt=fmt)
+        pd.testing.assert_frame_equal(got, want)
+
+
+def test_bytes_paths():
+    for fp in samples:
+        pd.testing.assert_frame_equal(reader.smart_reader(os.fsencode(fp)),
+                                      reader.smart_reader(fp))
+
+
+def test_sniff_format():
+    assert reader.sniff_format(
+        b'<?xml version="1.0"?>\n<gpx xmlns="http://www.topografix.com/'
+        b'GPX/1/1"><trk>') == 'gpx'
+    assert reader.sniff_format(
+        b'\xef\xbb\xbf<pwx xmlns="http://www.peaksware.com/PWX/1/0">'
+        b'<workout>') == 'pwx'
+    assert reader.sniff_format(b'<html><body>') is None
+    assert reader.sniff_format(b'not xml at all') is None
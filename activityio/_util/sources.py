@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Files can be read from a path, from their contents (any bytes-like object) or
+from a binary file object, so that data received in memory doesn't have to
+be written out first.
+
+"""
+from contextlib import contextmanager
+from io import BytesIO
+from os import PathLike
+
+
+# Enough of the start of a file to recognise it by.
+HEAD_SIZE = 64
+
+
+def is_path(source):
+    return (isinstance(source, (str, PathLike))
+            or isinstance(source, bytes) and not is_contents(source))
+
+
+def is_file_object(source):
+    return hasattr(source, 'read')
+
+
+def is_contents(source):
+    """Whether `source` holds the contents of a file.
+
+    ``bytes`` can also be a path (e.g. from ``os.fsencode``), so they're only
+    taken as contents if they look like a file: binary (FIT and SRM) headers
+    have NUL bytes in them, which paths can't, and XML starts with '<'.
+    """
+    if isinstance(source, (bytearray, memoryview)):
+        return True
+    if not isinstance(source, bytes):
+        return False
+    head = source[:HEAD_SIZE]
+    return (not head or b'\x00' in head
+            or head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<'))
+
+
+@contextmanager
+def open_source(source):
+    """Open `source` (a path, bytes-like or binary file object) for reading.
+
+    Yields a binary file object. Files opened here are closed afterwards, but
+    file objects passed in are left open.
+    """
+    if is_contents(source):
+        yield BytesIO(source)
+    elif is_file_object(source):
+        yield source
+    else:
+        with open(source, 'rb') as reader:
+            yield reader
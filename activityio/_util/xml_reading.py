@@ -9,22 +9,28 @@ library package.
 """
 from xml.etree.cElementTree import iterparse
 
+from activityio._util.sources import open_source
 
-def gen_nodes(file_path, node_names, *, with_root=False):
+
+def gen_nodes(source, node_names, *, with_root=False):
     """Efficiently iterate over specific nodes of an XML document.
 
+    `source` can be a path, the document itself (bytes-like) or a file
+    object.
+
     http://effbot.org/zone/element-iterparse.htm
     """
-    context = iter(iterparse(file_path, events=('start', 'end')))
-    event, root = next(context)  # get the root element
+    with open_source(source) as reader:
+        context = iter(iterparse(reader, events=('start', 'end')))
+        event, root = next(context)  # get the root element
 
-    if with_root:
-        yield root
+        if with_root:
+            yield root
 
-    for event, element in context:
-        if event == 'end' and sans_ns(element.tag) in node_names:
-            yield element
-            root.clear()
+        for event, element in context:
+            if event == 'end' and sans_ns(element.tag) in node_names:
+                yield element
+                root.clear()
 
 
 def recursive_text_extract(node):
@@ -7,10 +7,12 @@ in the FIT SDK materials [1]_.
 
 The reading internals---i.e. the protocol implementation---are in the
 `_protocol` module. This relies, in turn, on a data module (`_profile`)
-wrangled from the "Profile.xlsx" file that comes with the FIT SDK. Do not
-try to read this module. It is thoroughly disgusting. The development
-version of this package includes the subdirectory "_make_profile" which
-better exposes the logic for this module. Read that instead.
+wrangled from the "Profile.xlsx" file that comes with the FIT SDK. Most of
+the profile lives in a pickle (`_profile.pickle`) next to that module, and
+each message type is only unpickled when it is first encountered. The
+development version of this package includes the subdirectory
+"_make_profile" which better exposes the logic for this module. Read that
+instead.
 
 
 .. [1] https://www.thisisant.com/resources/fit
@@ -18,4 +20,11 @@ better exposes the logic for this module. Read that instead.
 
 """
 from activityio.fit._reading import read_and_format as read
-from activityio.fit._reading import gen_records
+from activityio.fit._reading import gen_records, read_all
+from activityio.fit._reading import read_high_rate
+from activityio.fit._reading import read_window, read_messages
+from activityio.fit._index import build_index, load_index
+from activityio.fit._parallel import read_parallel
+from activityio.fit._summary import read_summary
+from activityio.fit._tail import TailReader
+from activityio.fit._writing import write
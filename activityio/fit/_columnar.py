@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collect decoded FIT data as columns rather than records.
+
+Building a dictionary per message and handing millions of them to
+``DataFrame.from_records`` is slow and memory hungry. Instead, each value is
+written straight into a typed NumPy buffer for its (message name, field)
+pair, and frames are built from those arrays directly.
+
+"""
+import numpy as np
+
+
+INITIAL_CAPACITY = 1024
+
+
+def dtype_for(value):
+    """Pick a buffer type for a column based on its first value.
+
+    Numbers are stored as floats so that missing values can be NaN. Anything
+    else (including arrays) is stored as objects.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.float64
+    else:
+        return object
+
+
+class MessageColumns:
+    """Typed, growable columns for one type of FIT message.
+
+    Fields can appear part way through a file (or disappear from some
+    messages), so each column is filled with a missing value until it is
+    written to.
+
+    Attributes
+    ----------
+    n_rows : int
+        Number of messages added so far.
+    buffers : dict
+        NumPy arrays, by column key, over-allocated to `capacity`.
+    categories : dict
+        Enums (code to name mappings) of the enum columns, which hold codes,
+        by column key, for turning them into categoricals.
+    """
+    __slots__ = ('n_rows', 'capacity', 'buffers', 'categories')
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.n_rows = 0
+        self.capacity = capacity
+        self.buffers = {}
+        self.categories = {}
+
+    def __len__(self):
+        return self.n_rows
+
+    def __contains__(self, key):
+        return key in self.buffers
+
+    def append(self, fields):
+        """Add a single message given (key, value) pairs."""
+        row = self.n_rows
+        if row == self.capacity:
+            self._grow(row + 1)
+
+        buffers = self.buffers
+        for key, value in fields:
+            buffer = buffers.get(key)
+            if buffer is None:
+                buffer = self._new_buffer(key, dtype_for(value))
+            try:
+                buffer[row] = value
+            except (TypeError, ValueError):   # e.g. a string in a float column
+                buffer = buffers[key] = buffer.astype(object)
+                buffer[row] = value
+
+        self.n_rows = row + 1
+
+    def extend(self, n_rows, columns):
+        """Add `n_rows` messages at once given (key, array) pairs.
+
+        Two dimensional arrays (from array fields) are stored a row per
+        message, with rows that are entirely missing stored as NaN.
+        """
+        start, stop = self.n_rows, self.n_rows + n_rows
+        if stop > self.capacity:
+            self._grow(stop)
+
+        buffers = self.buffers
+        for key, values in columns:
+            if values.ndim > 1:
+                values = rows_of(values)
+            buffer = buffers.get(key)
+            if buffer is None:
+                dtype = np.float64 if values.dtype.kind == 'f' else object
+                buffer = self._new_buffer(key, dtype)
+            elif buffer.dtype != values.dtype and buffer.dtype != object:
+                buffer = buffers[key] = buffer.astype(object)
+            buffer[start:stop] = values
+
+        self.n_rows = stop
+
+    def get(self, key, default=None):
+        """Trimmed column by key."""
+        buffer = self.buffers.get(key)
+        return default if buffer is None else buffer[:self.n_rows]
+
+    def to_dict(self):
+        """Trimmed columns by key, in the order they were first seen."""
+        n_rows = self.n_rows
+        return {key: buffer[:n_rows] for key, buffer in self.buffers.items()}
+
+    def _new_buffer(self, key, dtype):
+        buffer = np.full(self.capacity, np.nan, dtype=dtype)
+        self.buffers[key] = buffer
+        return buffer
+
+    def _grow(self, min_capacity):
+        capacity = max(2 * self.capacity, min_capacity)
+        for key, buffer in self.buffers.items():
+            new = np.full(capacity, np.nan, dtype=buffer.dtype)
+            new[:self.n_rows] = buffer[:self.n_rows]
+            self.buffers[key] = new
+        self.capacity = capacity
+
+
+def rows_of(values):
+    """Object array holding each row of 2D `values`."""
+    rows = np.empty(len(values), dtype=object)
+    rows[:] = list(values)
+    rows[~(values == values).any(axis=1)] = np.nan   # NaN != NaN
+    return rows
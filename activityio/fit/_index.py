@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Index *.fit files for random access.
+
+A single pass over a file records where every message starts, which
+definition message is in effect for it, its (global) name and timestamp.
+Data bodies aren't decoded---runs of the same message are indexed in bulk
+from their header bytes and timestamp fields---so this is cheap.
+
+With an index, the messages wanted (say the 'session', or the records in a
+time window) can be decoded by seeking straight to them and their
+definitions. Indexes can be saved next to the file they describe.
+
+"""
+import os
+from struct import Struct
+
+import numpy as np
+
+from activityio.fit._protocol import (
+    DEVELOPER_MESSAGES, INVALID_TIMESTAMP, MIN_RUN_LENGTH,
+    CompressedTimestampHeader, DataMessageRun, NormalHeader,
+    compressed_timestamp, compressed_timestamps, count_run, next_segment,
+    open_fit, read_file_header, read_fit_message)
+from activityio._util import exceptions
+
+
+INDEX_SUFFIX = '.index.npz'
+
+NO_TIMESTAMP = -1
+
+# Of `MessageIndex` attributes, less `names`.
+COLUMN_DTYPES = (np.int64, np.uint8, np.int64, np.uint16, np.int64)
+
+
+class MessageIndex:
+    """Where each message of a *.fit file is.
+
+    Attributes
+    ----------
+    offsets : numpy.ndarray
+        Byte offset of each message (its record header).
+    headers : numpy.ndarray
+        Record header byte of each message.
+    def_offsets : numpy.ndarray
+        Byte offset of the definition message in effect for each message
+        (definition messages point to themselves).
+    name_codes : numpy.ndarray
+        Global message name of each message, as an index into `names`.
+    names : list of str
+        Distinct global message names.
+    timestamps : numpy.ndarray
+        Raw timestamp (seconds since the FIT epoch) of each message, or of
+        the last message before it that had one. -1 before any timestamp.
+    """
+    __slots__ = ('offsets', 'headers', 'def_offsets', 'name_codes', 'names',
+                 'timestamps')
+
+    def __init__(self, offsets, headers, def_offsets, name_codes, names,
+                 timestamps):
+        self.offsets, self.headers = offsets, headers
+        self.def_offsets = def_offsets
+        self.name_codes, self.names = name_codes, list(names)
+        self.timestamps = timestamps
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def is_data(self):
+        """Mask of data (i.e. not definition) messages."""
+        headers = self.headers
+        return (headers & 0x80 != 0) | (headers & 0x40 == 0)
+
+    def positions(self, name, start=None, stop=None):
+        """Positions (in the index) of the data messages called `name`,
+        optionally only those timestamped within [`start`, `stop`).
+
+        `start` and `stop` are raw timestamps (seconds since the FIT epoch).
+        """
+        try:
+            code = self.names.index(name)
+        except ValueError:
+            return np.array([], dtype=np.intp)
+
+        mask = self.is_data & (self.name_codes == code)
+        if start is not None:
+            mask &= self.timestamps >= start
+        if stop is not None:
+            mask &= self.timestamps < stop
+        return np.flatnonzero(mask)
+
+    def save(self, file):
+        """Save to `file` (a path or file object) in NumPy's npz format."""
+        np.savez(file, offsets=self.offsets, headers=self.headers,
+                 def_offsets=self.def_offsets, name_codes=self.name_codes,
+                 names=np.array(self.names, dtype=str),
+                 timestamps=self.timestamps)
+
+    @classmethod
+    def load(cls, file):
+        """Load an index written by `save`."""
+        with np.load(file, allow_pickle=False) as arrays:
+            return cls(arrays['offsets'], arrays['headers'],
+                       arrays['def_offsets'], arrays['name_codes'],
+                       arrays['names'].tolist(), arrays['timestamps'])
+
+
+class IndexColumns:
+    """Columns of a `MessageIndex` as they're built.
+
+    Single messages are appended to `lists`, and runs added as arrays, so
+    each entry is only converted (to an array) once.
+    """
+    __slots__ = ('lists', 'chunks')
+
+    def __init__(self):
+        self.lists = tuple([] for __ in COLUMN_DTYPES)
+        self.chunks = []
+
+    def append(self, *values):
+        for column, value in zip(self.lists, values):
+            column.append(value)
+
+    def extend(self, *arrays):
+        self._flush()
+        self.chunks.append(arrays)
+
+    def to_arrays(self):
+        self._flush()
+        if not self.chunks:
+            return [np.array([], dtype=dtype) for dtype in COLUMN_DTYPES]
+        return [np.concatenate(column).astype(dtype, copy=False)
+                for column, dtype in zip(zip(*self.chunks), COLUMN_DTYPES)]
+
+    def _flush(self):
+        if self.lists[0]:
+            self.chunks.append(tuple(np.array(column, dtype=dtype) for
+                                     column, dtype in zip(self.lists,
+                                                          COLUMN_DTYPES)))
+            for column in self.lists:
+                column.clear()
+
+
+def build_index(source):
+    """Index every message in a *.fit file.
+
+    Parameters
+    ----------
+    source : str, bytes-like or file object
+        Path to the file, its contents, or a binary file object.
+
+    Returns
+    -------
+    MessageIndex
+    """
+    columns = IndexColumns()
+    names = {}   # codes, by name
+    defined = {}   # see `definition_info`, by local message type
+
+    with open_fit(source) as fitfile:
+        while True:
+            read_file_header(fitfile)
+
+            while fitfile.bytes_left > 0:
+                offset = fitfile.offset
+                header_byte = fitfile.buffer[offset]
+
+                if not header_byte & 0x80 and header_byte & 0x40:
+                    message = read_fit_message(fitfile)   # a definition
+                    info = definition_info(message, offset, names)
+                    defined[message.header.local_message_type] = info
+                    columns.append(offset, header_byte, offset, info[2],
+                                   timestamp_or_none(fitfile.last_timestamp))
+                else:
+                    index_data_run(fitfile, defined, columns)
+
+            if not next_segment(fitfile):
+                break
+            defined.clear()
+
+    offsets, headers, def_offsets, name_codes, timestamps = (
+        columns.to_arrays())
+
+    return MessageIndex(offsets, headers, def_offsets, name_codes,
+                        sorted(names, key=names.get), timestamps)
+
+
+def definition_info(def_message, offset, names):
+    """What indexing the data messages of a definition needs, worked out
+    once: the definition, its `offset`, the code of its name in `names` and
+    the struct and offset (if any) to unpack a message's timestamp with."""
+    timestamp = None
+    if def_message.timestamp_field is not None:
+        dtype, field_offset = def_message.dtype.fields[
+            'f%d' % def_message.timestamp_field][:2]
+        timestamp = Struct(def_message.endian + dtype.char), field_offset
+    code = names.setdefault(def_message.name, len(names))
+    return def_message, offset, code, timestamp
+
+
+def index_data_run(fitfile, defined, columns):
+    """Index the run of data messages at the current offset, and skip it.
+
+    Entries are added to `columns` (an `IndexColumns`). Short runs are
+    indexed one message at a time, which is much cheaper than setting up
+    arrays for them. Also keeps `fitfile.last_timestamp` up to date, as
+    decoding would.
+    """
+    header_byte = fitfile.buffer[fitfile.offset]
+    compressed = header_byte & 0x80
+    local_type = header_byte >> 5 & 0x3 if compressed else header_byte & 0xF
+
+    info = defined.get(local_type)
+    if info is None:
+        raise exceptions.FITMessageHeaderError(
+            'invalid local message type (%d)' % local_type)
+    def_message, def_offset, code, timestamp = info
+
+    stride = 1 + def_message.struct.size
+    count = count_run(fitfile, header_byte, stride,
+                      0xE0 if compressed else 0xFF)
+    if not count:   # not all there (i.e. a truncated file)
+        raise exceptions.FITMessageHeaderError(
+            'truncated data message at offset %d' % fitfile.offset)
+
+    if count < MIN_RUN_LENGTH:
+        index_messages(fitfile, count, stride, compressed, def_offset, code,
+                       timestamp, columns)
+        return
+
+    array = np.frombuffer(fitfile.buffer, dtype=def_message.dtype,
+                          count=count, offset=fitfile.offset)
+
+    last = fitfile.last_timestamp
+    if compressed:
+        if last is None:
+            timestamps = np.full(count, NO_TIMESTAMP, dtype=np.int64)
+        else:
+            timestamps = compressed_timestamps(last, array['header'] & 0x1F)
+    elif timestamp is not None:
+        raw = array['f%d' % def_message.timestamp_field].astype(np.int64)
+        timestamps = carry_forward(raw, raw != INVALID_TIMESTAMP,
+                                   timestamp_or_none(last))
+    else:
+        timestamps = np.full(count, timestamp_or_none(last), dtype=np.int64)
+    headers = array['header'].copy()
+    del array   # a view of the buffer, which may be closed soon
+
+    if timestamps[-1] != NO_TIMESTAMP:
+        fitfile.last_timestamp = int(timestamps[-1])
+
+    offsets = fitfile.offset + stride * np.arange(count, dtype=np.int64)
+    fitfile.skip_bytes(count * stride)
+
+    columns.extend(offsets, headers,
+                   np.full(count, def_offset, dtype=np.int64),
+                   np.full(count, code, dtype=np.uint16), timestamps)
+
+
+def index_messages(fitfile, count, stride, compressed, def_offset, code,
+                   timestamp, columns):
+    """Scalar version of `index_data_run`, for `count` messages."""
+    buffer, offset = fitfile.buffer, fitfile.offset
+    last = fitfile.last_timestamp
+    offsets, headers, def_offsets, name_codes, timestamps = columns.lists
+
+    for offset in range(offset, offset + count * stride, stride):
+        header_byte = buffer[offset]
+        if compressed:
+            if last is not None:
+                last = compressed_timestamp(last, header_byte & 0x1F)
+        elif timestamp is not None:
+            value, = timestamp[0].unpack_from(buffer, offset + timestamp[1])
+            if value != INVALID_TIMESTAMP:
+                last = value
+
+        offsets.append(offset)
+        headers.append(header_byte)
+        def_offsets.append(def_offset)
+        name_codes.append(code)
+        timestamps.append(NO_TIMESTAMP if last is None else last)
+
+    fitfile.last_timestamp = last
+    fitfile.skip_bytes(count * stride)
+
+
+def carry_forward(values, valid, default):
+    """Replace invalid `values` with the last valid one before them (or
+    `default`, if there isn't one)."""
+    last_valid = np.maximum.accumulate(
+        np.where(valid, np.arange(len(values)), -1))
+    return np.where(last_valid >= 0, values[last_valid], default)
+
+
+def timestamp_or_none(timestamp):
+    return NO_TIMESTAMP if timestamp is None else timestamp
+
+
+def index_path(file_path):
+    """Where the index of `file_path` is saved."""
+    return os.fsdecode(file_path) + INDEX_SUFFIX
+
+
+def load_index(file_path, *, save=False):
+    """Load the saved index of `file_path`, (re)building it if it's missing
+    or older than the file. New indexes are only saved if `save` is True."""
+    saved = index_path(file_path)
+    if (os.path.exists(saved)
+            and os.path.getmtime(saved) >= os.path.getmtime(file_path)):
+        return MessageIndex.load(saved)
+
+    index = build_index(file_path)
+    if save:
+        index.save(saved)
+    return index
+
+
+def gen_indexed_messages(source, index, positions, *, runs=True):
+    """Decode the data messages at `positions` in `index`.
+
+    Only the definitions in effect for those messages are decoded (and
+    yielded) first, along with any developer data messages before them.
+
+    Parameters
+    ----------
+    source : str or bytes-like
+        The file that `index` describes, or its contents.
+    index : MessageIndex
+    positions : array-like of int
+        Positions in `index`, in ascending order.
+    runs : bool, optional
+        Decode consecutive messages of the same definition in bulk, as a
+        ``DataMessageRun``.
+
+    Yields
+    ------
+    DefintionMessage, DataMessage or DataMessageRun
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    if not positions.size:
+        return
+
+    # Developer fields are described by earlier data messages.
+    developer = np.flatnonzero(np.in1d(
+        index.name_codes, [index.names.index(name) for name in
+                           DEVELOPER_MESSAGES if name in index.names]))
+    developer = developer[index.is_data[developer]
+                          & (developer < positions[-1])]
+    positions = np.union1d(developer, positions)
+
+    with open_fit(source) as fitfile:
+        read_file_header(fitfile)
+        loaded = {}   # definition offsets, by local message type
+
+        for group in np.split(positions, run_splits(index, positions)):
+            first = group[0]
+            header_byte = int(index.headers[first])
+            local_type = (header_byte >> 5 & 0x3 if header_byte & 0x80 else
+                          header_byte & 0xF)
+
+            def_offset = int(index.def_offsets[first])
+            if loaded.get(local_type) != def_offset:
+                fitfile.seek(def_offset)
+                yield read_fit_message(fitfile)
+                loaded[local_type] = def_offset
+            def_message = fitfile.local_messages[local_type]
+
+            fitfile.seek(int(index.offsets[first]))
+            previous = index.timestamps[first - 1] if first else NO_TIMESTAMP
+            fitfile.last_timestamp = (None if previous == NO_TIMESTAMP else
+                                      int(previous))
+
+            if (runs and len(group) >= MIN_RUN_LENGTH
+                    and not def_message.has_dynamic
+                    and def_message.name not in DEVELOPER_MESSAGES):
+                header = (CompressedTimestampHeader(header_byte)
+                          if header_byte & 0x80 else
+                          NormalHeader(header_byte))
+                yield DataMessageRun(header, fitfile, len(group))
+            else:
+                for __ in group:
+                    yield read_fit_message(fitfile)
+
+
+def run_splits(index, positions):
+    """Where to split `positions` (in `index`, ascending) into groups of
+    consecutive messages of the same definition, which could be decoded
+    together (as for ``numpy.split``)."""
+    headers = index.headers[positions]
+    keys = np.where(headers & 0x80, headers & 0xE0, headers)
+    return np.flatnonzero((np.diff(positions) != 1)
+                          | (np.diff(keys) != 0)) + 1
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decode large *.fit files on several processes.
+
+Decoding can't simply start part way through a file, because data messages
+can only be read with the definition message in effect for them. So this is
+done in two phases. First a `MessageIndex` is built, which is a cheap scan
+recording where every message starts, the definition in effect for it and
+the last timestamp before it. Then the records are split into chunks, each
+decoded (from its definitions) in a process pool, and the results joined
+back together in order. Accumulated fields are only unwrapped once joined.
+
+This only pays off for files with a lot of messages decoded one at a time,
+e.g. records interleaved with other messages, on several CPUs: runs of
+records are decoded in bulk anyway, faster than the index can be built and
+the processes started. Otherwise files are read serially.
+
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+from activityio.fit._columnar import MessageColumns
+from activityio.fit._index import gen_indexed_messages, run_splits
+from activityio.fit._protocol import MIN_RUN_LENGTH, fit_source
+from activityio.fit._reading import (
+    collect_record_columns, format_record_columns, get_index,
+    read_and_format)
+
+
+# Fewer messages decoded one at a time than this (around a second's work)
+# aren't worth a process of their own.
+MIN_CHUNK = 50000
+
+_worker = {}   # the file being decoded, and its index, in each process
+
+
+def read_parallel(file_path, *, processes=None, index=None,
+                  save_index=False, tz_str=None, min_chunk=MIN_CHUNK):
+    """Like `read_and_format`, but decoding chunks of the file in parallel.
+
+    Parameters
+    ----------
+    file_path : str, bytes-like or file object
+        Path to the fit file, its contents, or a binary file object.
+    processes : int, optional
+        Number of worker processes (by default, the number of CPUs this
+        process can use). With fewer than two, the file is simply read
+        with `read_and_format`.
+    index : MessageIndex, optional
+        Index of the file (see `read_window`).
+    save_index : bool, optional
+        See `read_window`.
+    tz_str : str, optional
+        Time zone of the returned timestamps (UTC by default).
+    min_chunk : int, optional
+        Smallest number of messages decoded one at a time (each run decoded
+        in bulk counts as one) by a process. Files too small to split are
+        decoded in this process.
+    """
+    file_path = fit_source(file_path)
+    processes = processes or available_cpus()
+    if processes < 2:
+        return read_and_format(file_path, tz_str=tz_str)
+
+    index = get_index(file_path, index, save_index)
+    positions = np.union1d(index.positions('record'), index.positions('lap'))
+
+    n_chunks = max(1, min(processes,
+                          decoding_work(index, positions) // min_chunk))
+    chunks = np.array_split(positions, n_chunks)
+
+    if n_chunks == 1:
+        init_worker(file_path, index)
+        decoded = [decode_chunk(positions)]
+    else:
+        with ProcessPoolExecutor(n_chunks, initializer=init_worker,
+                                 initargs=(file_path, index)) as pool:
+            decoded = list(pool.map(decode_chunk, chunks))
+    _worker.clear()
+
+    return format_record_columns(*join_record_columns(decoded),
+                                 tz_str=tz_str)
+
+
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:   # not on every platform
+        return os.cpu_count() or 1
+
+
+def decoding_work(index, positions):
+    """Rough cost of decoding the messages at `positions` in `index`: the
+    number decoded one at a time, plus one for each run decoded in bulk."""
+    lengths = np.diff(np.concatenate(
+        ([0], run_splits(index, positions), [len(positions)])))
+    singles = lengths < MIN_RUN_LENGTH
+    return int(lengths[singles].sum() + np.count_nonzero(~singles))
+
+
+def init_worker(source, index):
+    _worker['source'], _worker['index'] = source, index
+
+
+def decode_chunk(positions):
+    """`collect_record_columns` for the messages at `positions`."""
+    messages = gen_indexed_messages(_worker['source'], _worker['index'],
+                                    positions)
+    return collect_record_columns(messages)
+
+
+def join_record_columns(chunks):
+    """Join the `collect_record_columns` output of consecutive chunks."""
+    records, lap_starts, accumulated = MessageColumns(), [], {}
+
+    for chunk_records, chunk_lap_starts, chunk_accumulated in chunks:
+        n_records = len(records)
+        lap_starts.extend(n_records + start for start in chunk_lap_starts)
+        for key, (period, ranges) in chunk_accumulated.items():
+            accumulated.setdefault(key, (period, []))[1].extend(
+                [n_records + start, n_records + stop]
+                for start, stop in ranges)
+        records.extend(len(chunk_records), chunk_records.to_dict().items())
+        records.categories.update(chunk_records.categories)
+
+    return records, lap_starts, accumulated
@@ -2,30 +2,53 @@
 # -*- coding: utf-8 -*-
 """
 Implement the Flexible and Interoperable data Transfer (FIT) protocol.
-
-TODO:
------
-    + field components
-    + accumulators
-
 """
 from contextlib import contextmanager
-from struct import unpack
+from copy import copy
+import mmap
+from struct import Struct, unpack, unpack_from
+import warnings
+
+import numpy as np
 
+from activityio.fit._crc import crc16
 from activityio.fit._profile import (
-    BASE_TYPE_BYTE, BASE_TYPES, BASE_TYPES_BY_NAME,
-    MESSAGE_TYPES, TYPES_INFO, GLOBAL_MESG_NUMS)
+    BASE_TYPE_BYTE, BASE_TYPES, MESSAGE_FIELDS, GLOBAL_MESG_NUMS,
+    UNKNOWN_FIELD, FieldProfile)
 from activityio._util import exceptions
+from activityio._util.sources import is_contents, is_file_object
 
 
 EMPTY_DICT = {}    # single instance to save some memory
 
+CRC_MODES = ('strict', 'lenient', 'off')
+
+TIMESTAMP_FIELD_NUM = 253   # common to all messages
+UINT32 = 0x86               # base type number
+
+# Shortest run of same-definition data messages worth decoding in bulk.
+MIN_RUN_LENGTH = 8
+
+INVALID_TIMESTAMP = BASE_TYPES[UINT32].invalid
+
+# Data messages describing developer fields, which are always decoded.
+DEVELOPER_MESSAGES = frozenset({'developer_data_id', 'field_description'})
+
 
 class FitFile:
     """A file-like object specific to *.fit files.
 
+    Rather than reading from an open file, messages are decoded in place from
+    a single buffer---typically a memory-mapped file---using offsets. This
+    avoids a syscall and a new ``bytes`` object for every header, definition
+    and field.
+
     Attributes
     ----------
+    buffer : mmap.mmap, bytes or memoryview
+        Contents of the file.
+    offset : int
+        Current position in `buffer`.
     bytes_left : int
         Bytes left to be read in the file. Initialised to its proper value
         when the file header is read.
@@ -34,30 +57,69 @@ class FitFile:
         have been parsed from the file.
     profile_version, protocol_version : float
         File version information taken from the file header.
-    reader : _io.BufferedReader
-        Open file to be read.
+    header_size, data_size, data_start : int
+        Layout information taken from the file header.
+    last_timestamp : int
+        Most recent (raw) timestamp, used to expand compressed timestamps.
+    developers : dict
+        Decoded 'developer_data_id' messages, by developer data index.
+    developer_fields : dict
+        (base type number, FieldProfile) pairs from 'field_description'
+        messages, by (developer data index, field number).
+    developer_field_defs : dict
+        Field definitions built from `developer_fields`, by (developer data
+        index, field number, size, endian), shared by definition messages.
     """
-    def __init__(self, reader):
+    def __init__(self, buffer):
         """Initialise a new FitFile instance.
 
         Parameters
         ----------
-        reader : _io.BufferedReader
-            Returned value of the ``open`` builtin.
+        buffer : mmap.mmap, bytes or memoryview
+            Contents of the file to be decoded.
         """
-        self.reader = reader
+        self.buffer = buffer
+        self.offset = 0
         self.bytes_left = 0
+        self.reset()
+
+    def reset(self):
+        """Forget everything decoded so far, e.g. for a new (chained) file."""
         self.local_messages = {}   # i.e. definition messages, by number
+        self.last_timestamp = None
+        self.developers = {}
+        self.developer_fields = {}
+        self.developer_field_defs = {}
 
     def read(self, size):
-        """Read from an open file, keeping track of bytes left."""
+        """Read from the buffer, keeping track of bytes left."""
+        start = self.offset
+        self.offset += size
         self.bytes_left -= size
-        return self.reader.read(size)
+        return self.buffer[start:self.offset]
+
+    def read_byte(self):
+        """Read a single unsigned byte."""
+        value = self.buffer[self.offset]
+        self.offset += 1
+        self.bytes_left -= 1
+        return value
+
+    def unpack(self, compiled):
+        """Unpack a precompiled ``struct.Struct`` straight from the buffer."""
+        values = compiled.unpack_from(self.buffer, self.offset)
+        self.offset += compiled.size
+        self.bytes_left -= compiled.size
+        return values
 
     def skip_bytes(self, size):
-        """Seek an open file, keeping track of bytes left."""
+        """Move through the buffer, keeping track of bytes left."""
+        self.offset += size
         self.bytes_left -= size
-        self.reader.seek(size, 1)   # from current position
+
+    def seek(self, offset):
+        """Move to an absolute `offset`, keeping track of bytes left."""
+        self.skip_bytes(offset - self.offset)
 
     def set_version_info(self, version_info):
         """Decode version info the same way the FIT SDK does.
@@ -83,7 +145,8 @@ class FitMessageHeader:
     header is a special compressed header that may also be used with some
     local data messages to allow a compressed time format.
     """
-    __slots__ = ('_message_cls', 'local_message_type', 'time_offset')
+    __slots__ = ('_message_cls', 'local_message_type', 'time_offset',
+                 'has_developer_data')
 
     def message_cls(self, fitfile):
         return self._message_cls(self, fitfile)   # partial'd, kinda
@@ -106,6 +169,9 @@ class NormalHeader(FitMessageHeader):
       4          0        Reserved
      0-3        0-15      Local message type
     =====  =============  ========================
+
+    For definition messages, bit 5 flags that developer field definitions
+    follow the (native) field definitions.
     """
     __slots__ = tuple()
 
@@ -116,6 +182,7 @@ class NormalHeader(FitMessageHeader):
         # associated with this message
         self.local_message_type = header_byte & 0xF    # bits 0-3
         self.time_offset = None
+        self.has_developer_data = header_byte & 0x60 == 0x60
 
 
 class CompressedTimestampHeader(FitMessageHeader):
@@ -146,6 +213,7 @@ class CompressedTimestampHeader(FitMessageHeader):
         self._message_cls = DataMessage
         self.local_message_type = (header_byte >> 5) & 0x3   # bits 5-6
         self.time_offset = header_byte & 0x1F                # bits 0-4
+        self.has_developer_data = False
 
 
 class DefinitionMessage:
@@ -174,8 +242,24 @@ class DefinitionMessage:
      ...                              (per field)
     ======  =======================  =============  ===========================
 
+    The layout of the associated data messages is compiled into a single
+    ``struct.Struct`` when the definition is parsed, so that each data message
+    can be unpacked with one call. `decoders` maps each field definition to
+    the index of its (first) value in the unpacked tuple.
+
+    For decoding runs of data messages in bulk, the same layout (prefixed by
+    the record header byte) is also available as a structured NumPy `dtype`.
+
+    `timestamp_field` is the position (in `decoders`) of the timestamp field,
+    if there is one, and `timestamp_def` describes the timestamps expanded
+    from compressed timestamp headers.
+
+    Developer field definitions (if flagged in the header) follow the native
+    ones, and are laid out after them in the same compiled struct.
     """
-    __slots__ = ('header', 'name', 'type', 'field_defs')
+    __slots__ = ('header', 'name', 'fields', 'field_defs', 'struct',
+                 'decoders', 'endian', 'timestamp_field', 'timestamp_def',
+                 '_dtype')
 
     def __init__(self, header, fitfile):
         self.header = header
@@ -185,14 +269,96 @@ class DefinitionMessage:
 
         global_mesg_num, field_count = unpack(endian+'HB', fitfile.read(3))
         self.name = GLOBAL_MESG_NUMS.get(global_mesg_num, 'unknown')
-        self.type = MESSAGE_TYPES.get(self.name, EMPTY_DICT)
-
-        self.field_defs = [FieldDefinition(fitfile, self.type, endian)
-                           for _ in range(field_count)]
+        self.fields = MESSAGE_FIELDS.get(self.name, EMPTY_DICT)
+
+        self.field_defs = [
+            FieldDefinition.from_fitfile(fitfile, self.fields, endian)
+            for _ in range(field_count)]
+        if header.has_developer_data:
+            self.field_defs.extend(
+                FieldDefinition.from_developer(fitfile, endian)
+                for _ in range(fitfile.read_byte()))
+        self.struct, self.decoders = compile_layout(endian, self.field_defs)
+        index_subfields(self.field_defs, self.decoders)
+        index_components(self.field_defs, self.fields)
+        self.endian = endian
+        self._dtype = None
+
+        self.timestamp_field = next(
+            (k for k, (field_def, *__) in enumerate(self.decoders)
+             if field_def.number == TIMESTAMP_FIELD_NUM), None)
+        self.timestamp_def = FieldDefinition(
+            TIMESTAMP_FIELD_NUM, 4, UINT32,
+            self.fields.get(TIMESTAMP_FIELD_NUM, UNKNOWN_FIELD), endian)
 
         # Save this local message.
         fitfile.local_messages[header.local_message_type] = self
 
+    @property
+    def has_dynamic(self):
+        return any(field_def.is_dynamic for field_def in self.field_defs)
+
+    @property
+    def accumulated(self):
+        """Components of this message that are accumulated, i.e. that roll
+        over and need unwrapping (see `unwrap_accumulated`).
+
+        Returns
+        -------
+        [(name, period, units), (name, period, units), ...]
+            Where the period is in decoded (scaled) units.
+        """
+        return [(component_def.name,
+                 (mask + 1) / component_def.profile.scale,
+                 component_def.profile.units)
+                for field_def in self.field_defs
+                for __, mask, component_def, accumulate
+                in field_def.component_index if accumulate]
+
+    @property
+    def enums(self):
+        """Enum fields (and subfields) of this message, whose values can be
+        left as codes (see `FieldDefinition.is_enum`).
+
+        Returns
+        -------
+        [(name, enum, units), (name, enum, units), ...]
+            Where `enum` maps codes to names (from ``TYPES_INFO``).
+        """
+        enums = []
+        for field_def in self.field_defs:
+            if field_def.base_type.name != 'enum' or field_def.size != 1:
+                continue
+            profile = field_def.profile
+            enums.extend((profile.name, profile.enum, profile.units)
+                         for profile in (profile,) + profile.subfields
+                         if profile.enum is not None)
+        return enums
+
+    @property
+    def dtype(self):
+        """Structured dtype for a data message: header byte plus fields.
+
+        Fields are named by their position in `decoders` (names in the
+        profile aren't unique) and laid out at the same offsets as `struct`.
+        """
+        if self._dtype is None:
+            offsets, offset = {}, 1
+            for field_def in self.field_defs:
+                offsets[id(field_def)] = offset
+                offset += field_def.size
+
+            names, formats, field_offsets = ['header'], ['u1'], [0]
+            for i, (field_def, *__) in enumerate(self.decoders):
+                names.append('f%d' % i)
+                formats.append(field_def.numpy_fmt(self.endian))
+                field_offsets.append(offsets[id(field_def)])
+
+            self._dtype = np.dtype({'names': names, 'formats': formats,
+                                    'offsets': field_offsets,
+                                    'itemsize': offset})
+        return self._dtype
+
 
 class DataMessage:
     """The useful part of a *.fit file.
@@ -213,104 +379,158 @@ class DataMessage:
 
         self.name = def_message.name
 
-        # Not assigning to self yet as we need to filter out the
-        # invalid definitions and values.
-        field_defs = def_message.field_defs
-        field_values = [field.read(fitfile) for field in field_defs]
+        values = fitfile.unpack(def_message.struct)
 
-        # Invalid values (tested by .parse()) are returned as None.
-        valid = [i for i, val in enumerate(field_values) if val is not None]
-        # Get rid.
-        self.field_defs = [field_defs[i] for i in valid]
-        self.field_values = [field_values[i] for i in valid]
+        # Invalid values are left out (see `compile_layout`).
+        field_defs, field_values = [], []
+        for field_def, i, invalid, parse in def_message.decoders:
+            raw = values[i]
+            if parse is None:
+                if raw == invalid:
+                    continue
+                value = raw
+            else:
+                value = parse(raw)
+                if value is not None and field_def.is_dynamic:
+                    # Swap in the subfield picked out by the reference
+                    # value(s).
+                    field_def = field_def.resolve_subfield(values)
+                    value = field_def.read(raw)
+                if value is None:
+                    continue
 
-    def decode(self):
+            field_defs.append(field_def)
+            field_values.append(value)
+            if field_def.component_index:
+                bits = field_def.component_bits(raw)
+                for shift, mask, component_def, __ in \
+                        field_def.component_index:
+                    field_defs.append(component_def)
+                    field_values.append((bits >> shift) & mask)
+
+        timestamp_field = def_message.timestamp_field
+        if timestamp_field is not None:
+            timestamp = values[def_message.decoders[timestamp_field][1]]
+            if timestamp != INVALID_TIMESTAMP:
+                fitfile.last_timestamp = timestamp
+
+        time_offset = header.time_offset
+        if time_offset is not None and fitfile.last_timestamp is not None:
+            timestamp = compressed_timestamp(fitfile.last_timestamp,
+                                             time_offset)
+            fitfile.last_timestamp = timestamp
+            field_defs.append(def_message.timestamp_def)
+            field_values.append(timestamp)
+
+        self.field_defs = field_defs
+        self.field_values = field_values
+
+        if self.name in DEVELOPER_MESSAGES:
+            register_developer_data(fitfile, self)
+
+    def decode(self, *, enum_codes=False):
         """Decode like the FitCSVTool.
 
+        With `enum_codes`, enum fields are left as codes rather than looked
+        up by name (see `FieldDefinition.is_enum`).
+
         Returns
         -------
         [(name, value, units), (name, value, units), ...]
         """
         defs_values = zip(self.field_defs, self.field_values)
-        first_parse = [self._extract(*data) for data in defs_values]
-
-        has_subfields = any(field_def.is_dynamic
-                            for field_def in self.field_defs)
-
-        if has_subfields:
-            return self._resolve_subfields(first_parse)
-        else:
-            return first_parse
+        return [self._extract(*data, enum_codes) for data in defs_values]
 
     @staticmethod
-    def _extract(field_def, field_value):
+    def _extract(field_def, field_value, enum_codes=False):
         """Replicating the FitCSVTool output.
 
         Spits out a (name, value, units) tuple.
         """
-        name = field_def.name
+        profile = field_def.profile
 
         if isinstance(field_value, bytes):
             value = field_value
-        elif name in TYPES_INFO:
-            value = TYPES_INFO[name].get(field_value, field_value)
+        elif isinstance(field_value, np.ndarray):   # array field
+            value = decode_column(field_def, field_value)
+        elif enum_codes and field_def.is_enum:
+            value = field_value
+        elif profile.enum is not None:
+            value = profile.enum.get(field_value, field_value)
         else:
-            value = apply_scale_offset(field_def, field_value)
+            value = field_value / profile.scale - profile.offset
 
-        units = field_def.data.get('units', '')
+        return field_def.name, value, profile.units
 
-        return name, value, units
 
-    def _resolve_subfields(self, first_parse):
-        """Go back over parsed data to resolve dynamic fields.
+class DataMessageRun:
+    """Consecutive data messages that share a definition (and header byte).
 
-        Note: record messages don't have subfields.
-        """
-        field_def_names = tuple(field_def.name
-                                for field_def in self.field_defs)
-        bad_messages = []
+    In real files most of the data section is long runs of record messages,
+    so these are read with a single ``np.frombuffer`` using the structured
+    dtype of the definition, and decoded column by column.
+    """
+    __slots__ = ('header', 'name', 'def_message', 'array', 'timestamps')
 
-        # Need lists here for mutability.
-        names, values, units = (list(column) for column in zip(*first_parse))
+    def __init__(self, header, fitfile, count):
+        self.header = header
 
-        for i, field in enumerate(zip(self.field_defs, values)):
+        def_message = fitfile.local_messages[header.local_message_type]
+        self.name = def_message.name
+        self.def_message = def_message
 
-            if is_dynamic(*field):    # also the value
-                field_def, raw = field
-                subfields = field_def.data['subfields']
+        dtype = def_message.dtype
+        # Copy out of the buffer so that we aren't holding on to the file.
+        self.array = array = np.frombuffer(
+            fitfile.buffer, dtype=dtype, count=count,
+            offset=fitfile.offset).copy()
+        fitfile.skip_bytes(count * dtype.itemsize)
 
-                # Find the name of the field definition from which
-                # we should to retrieve the parsed value.
-                ref_field_name = single_from(subf['ref_field_name']
-                                             for subf in subfields.values())
+        # Expanded compressed timestamps (if applicable).
+        self.timestamps = None
 
-                try:
-                    # The value that tells us which subfield to use.
-                    ref_value = values[field_def_names.index(ref_field_name)]
-                except ValueError:
-                    bad_messages.append(i)   # scrap this message
-                    continue
+        if header.time_offset is not None:
+            if fitfile.last_timestamp is not None:
+                self.timestamps = compressed_timestamps(
+                    fitfile.last_timestamp, array['header'] & 0x1F)
+                fitfile.last_timestamp = int(self.timestamps[-1])
 
-                try:
-                    # They key to the matching subfield.
-                    subfield_key, = (key for key, value in subfields.items()
-                                     if ref_value in value['ref_field_value'])
-                except ValueError:
-                    bad_messages.append(i)   # scrap this message
-                    continue
+        elif def_message.timestamp_field is not None:
+            timestamps = array['f%d' % def_message.timestamp_field]
+            valid = timestamps[timestamps != INVALID_TIMESTAMP]
+            if valid.size:
+                fitfile.last_timestamp = int(valid[-1])
+
+    def __len__(self):
+        return len(self.array)
+
+    def decode_columns(self, *, enum_codes=False):
+        """Column-wise equivalent of ``DataMessage.decode``.
 
-                subfield_match = subfields[subfield_key]
+        Fields that are invalid for every message are dropped; otherwise
+        invalid values are NaN.
 
-                new_name = subfield_match['field_name']
-                new_base_type = BASE_TYPES_BY_NAME.get(new_name, BASE_TYPE_BYTE)
-                field_def.update(name=new_name, base_type=new_base_type)
+        Returns
+        -------
+        [(name, values, units), (name, values, units), ...]
+        """
+        columns = []
+        for i, (field_def, *__) in enumerate(self.def_message.decoders):
+            raw = self.array['f%d' % i]
+            values = decode_column(field_def, raw, enum_codes)
+            if values is None:
+                continue
+            columns.append((field_def.name, values, field_def.profile.units))
+            if field_def.component_index:
+                columns.extend(decode_components(field_def, raw))
 
-                names[i] = new_name
-                values[i] = field_def.read(raw=raw)
-                units[i] = subfield_match.get('units', '')
+        if self.timestamps is not None:
+            timestamp_def = self.def_message.timestamp_def
+            columns.append((timestamp_def.name,
+                            decode_column(timestamp_def, self.timestamps),
+                            timestamp_def.profile.units))
 
-        return list(data for i, data in enumerate(zip(names, values, units))
-                    if i not in bad_messages)
+        return columns
 
 
 class FieldDefinition:
@@ -329,51 +549,181 @@ class FieldDefinition:
       2     Base type          Base type of the specified FIT message's field.
     ======  =================  ===============================================
 
+    The field is bound to its ``FieldProfile`` (if it has one), which holds
+    everything else needed to decode it. Dynamic fields also carry a
+    `subfield_index`: (index, {reference value: subfield definition}) pairs,
+    where index locates the raw reference value in an unpacked data message.
+    Fields with components carry a `component_index`: (shift, mask, component
+    definition, accumulate) tuples for picking the components out of the
+    field's bits.
     """
-    __slots__ = ('size', 'base_type', 'data', 'is_dynamic', 'name', 'endian')
+    __slots__ = ('number', 'size', 'base_type', 'profile', 'is_dynamic',
+                 'name', 'endian', 'subfield_index', 'component_index')
 
-    def __init__(self, fitfile, message_type, endian):
-        # NOTE: reading single bytes, so no need to apply endianness here.
-        def_num, self.size, base_type_num = unpack('<3B', fitfile.read(3))
+    def __init__(self, number, size, base_type_num, profile, endian):
+        self.number, self.size = number, size
         self.base_type = BASE_TYPES.get(base_type_num, BASE_TYPE_BYTE)
-        self.data = message_type.get(def_num, EMPTY_DICT)
-        self.is_dynamic = 'subfields' in self.data
-        self.name = self.data.get('field_name', 'unknown')
+        self.profile = profile
+        self.is_dynamic = self.profile.is_dynamic
+        self.name = self.profile.name
         self.endian = endian   # for reference
+        self.subfield_index = ()   # see `index_subfields`
+        self.component_index = ()   # see `index_components`
 
-    @property
-    def n_bytes(self):
-        return self.size // self.base_type.size
+    @classmethod
+    def from_fitfile(cls, fitfile, message_fields, endian):
+        # NOTE: reading single bytes, so no need to apply endianness here.
+        number, size, base_type_num = unpack('<3B', fitfile.read(3))
+        return cls(number, size, base_type_num,
+                   message_fields.get(number, UNKNOWN_FIELD), endian)
 
-    @property
-    def fmt(self):
-        """Format for struct.unpacking."""
-        return '{0.endian}{0.n_bytes}{0.base_type.fmt}'.format(self)
+    @classmethod
+    def from_developer(cls, fitfile, endian):
+        """From the FIT SDK release 20.03.00
 
-    def read(self, fitfile=None, raw=None):
-        """Parse data from this field definition.
+        Developer field definitions are the same size as field definitions,
+        but the last byte is the developer data index instead of a base type;
+        the base type comes from the matching 'field_description' message.
 
-        Data is either read directly from the file or an existing buffer. If
-        this is a dynamic field definition (i.e. has subfields) and we're
-        reading from a file, raw bytes are returned.
+        Definitions are cached on `fitfile`, as the same developer fields
+        tend to be used by several definition messages. They have no
+        (native) field number.
         """
+        number, size, index = unpack('<3B', fitfile.read(3))
+        key = (index, number, size, endian)
+        field_def = fitfile.developer_field_defs.get(key)
+        if field_def is None:
+            base_type_num, profile = fitfile.developer_fields.get(
+                (index, number), (BASE_TYPE_BYTE.identifier, UNKNOWN_FIELD))
+            field_def = cls(None, size, base_type_num, profile, endian)
+            fitfile.developer_field_defs[key] = field_def
+        return field_def
 
-        # Dynamic fields need to be unpacked later.
-        dont_unpack = self.is_dynamic and raw is None
+    @property
+    def layout(self):
+        """Format code for this field within a compiled data message struct,
+        and the number of values it unpacks to.
+
+        Dynamic fields and strings come out as raw bytes. Any trailing bytes
+        that don't fit the base type are padded over.
+        """
+        if self.is_dynamic or self.base_type.fmt == 's':
+            return '%ds' % self.size, 1
 
-        if raw is None:
-            raw = fitfile.read(self.size)
+        count, pad = divmod(self.size, self.base_type.size)
+        code = '%d%s' % (count, self.base_type.fmt)
+        if pad:
+            code += '%dx' % pad
+        return code, count
 
-        if dont_unpack:
+    @property
+    def is_enum(self):
+        """Whether this is a single enum value the profile has names for."""
+        return (self.base_type.name == 'enum' and self.size == 1
+                and self.profile.enum is not None)
+
+    def numpy_fmt(self, endian):
+        """NumPy equivalent of `layout` (ignoring any padding)."""
+        if self.is_dynamic or self.base_type.fmt == 's':
+            return 'S%d' % self.size
+
+        count = self.size // self.base_type.size
+        fmt = endian + self.base_type.fmt
+        return fmt if count == 1 else (fmt, (count,))
+
+    def read(self, raw):
+        """Parse the `raw` bytes of a dynamic field, once this (sub)field
+        has been picked for them (see `resolve_subfield`)."""
+        fmt = '%s%d%s' % (self.endian, self.size // self.base_type.size,
+                          self.base_type.fmt)
+        value, *__ = unpack_from(fmt, raw)
+        return self.parse(value)
+
+    def parse(self, value):
+        """A single unpacked `value`, or None if it's invalid."""
+        base_type = self.base_type
+        if base_type.fmt == 's':
+            return value.split(b'\x00')[0] or None
+        if value == base_type.invalid or value != value:   # NaN != NaN
+            return None
+        return value
+
+    def bind(self, profile):
+        """Copy this field definition, swapping in another (sub)field profile.
+
+        Subfields share the size and base type of their parent field.
+        """
+        bound = copy(self)
+        bound.profile, bound.name = profile, profile.name
+        bound.is_dynamic, bound.subfield_index = False, ()
+        bound.component_index = ()
+        return bound
+
+    def resolve_subfield(self, values):
+        """The subfield definition to use given a data message's raw
+        (unpacked) values, or this definition if none match."""
+        for i, subfields in self.subfield_index:
+            subfield = subfields.get(values[i])
+            if subfield is not None:
+                return subfield
+        return self
+
+    def parse_array(self, values):
+        """Unpacked array `values` as a NumPy array, or None if every
+        element is invalid."""
+        array = np.array(values, dtype=self.base_type.fmt)
+        return array if valid_mask(self.base_type, array).any() else None
+
+    def component_bits(self, raw):
+        """The whole of this field as a single integer, given its `raw`
+        (unpacked) value: bytes for dynamic fields, a tuple for arrays.
+
+        Array elements are joined least significant first.
+        """
+        if isinstance(raw, bytes):
+            return int.from_bytes(raw, 'little' if self.endian == '<' else
+                                  'big')
+        if not isinstance(raw, tuple):
             return raw
-        else:
-            value, *ignore = unpack(self.fmt, raw)  # TODO: check/improve this
-            return self.base_type.parse(value)      # checks validity
+        width = 8 * self.base_type.size
+        bits = 0
+        for k, value in enumerate(raw):
+            bits |= value << (k * width)
+        return bits
 
-    def update(self, **kwargs):
-        """Update instance attributes from kwargs."""
-        for name, value in kwargs.items():
-            setattr(self, name, value)
+
+def register_developer_data(fitfile, message):
+    """Keep a decoded 'developer_data_id' or 'field_description' message.
+
+    Field descriptions are turned into profiles for the developer fields of
+    later definition messages.
+    """
+    values = {field_def.name: value for field_def, value
+              in zip(message.field_defs, message.field_values)}
+    index = values.get('developer_data_index')
+    if index is None:
+        return
+
+    if message.name == 'developer_data_id':
+        fitfile.developers[index] = values
+        return
+
+    number = values.get('field_definition_number')
+    if number is None:
+        return
+
+    name = values.get('field_name', b'unknown').decode('utf-8', 'replace')
+    units = values.get('units', b'').decode('utf-8', 'replace')
+    profile = FieldProfile(number, name, None, units,
+                           values.get('scale') or 1, values.get('offset', 0),
+                           False, None, (), (), None, frozenset())
+    fitfile.developer_fields[index, number] = (
+        values.get('fit_base_type_id', BASE_TYPE_BYTE.identifier), profile)
+
+    # Anything built from an earlier description is out of date.
+    for key in [key for key in fitfile.developer_field_defs
+                if key[:2] == (index, number)]:
+        del fitfile.developer_field_defs[key]
 
 
 def read_file_header(fitfile):
@@ -381,6 +731,7 @@ def read_file_header(fitfile):
 
     Attributes added to `fitfile`:
         + version info (protocol_version and profile_version)
+        + layout info (header_size, data_size and data_start)
         + bytes_left
 
     The file object is also advanced to the start of the first message header.
@@ -398,15 +749,85 @@ def read_file_header(fitfile):
     if extra_header:
         if extra_header < 2:
             raise exceptions.FITFileHeaderError('irregular file header size')
+        if len(fitfile.buffer) - fitfile.offset < extra_header:
+            raise exceptions.FITFileHeaderError('file header is truncated')
 
         fitfile.skip_bytes(extra_header)
 
+    fitfile.header_size = header_size
+    fitfile.data_size = data_size
+    fitfile.data_start = fitfile.offset
     fitfile.bytes_left = data_size
 
 
+def next_segment(fitfile):
+    """Move on to the next *.fit file chained on to the end of this one.
+
+    Some tools concatenate files (each with its own header and CRC), so
+    another file header may follow the file CRC. Nothing decoded carries over
+    to the next file.
+
+    Returns
+    -------
+    bool
+        Whether there's another file.
+    """
+    start = fitfile.data_start + fitfile.data_size + 2   # skip the file CRC
+    buffer = fitfile.buffer
+    if len(buffer) < start + 12 or bytes(buffer[start+8:start+12]) != b'.FIT':
+        return False
+
+    fitfile.seek(start)
+    fitfile.reset()
+    return True
+
+
+def check_crc(fitfile, mode='strict'):
+    """Validate the header and file CRCs of a *.fit file.
+
+    Must be called after `read_file_header`. The whole file is checked in a
+    single pass over the buffer, which is much cheaper than decoding it.
+
+    Parameters
+    ----------
+    fitfile : FitFile
+    mode : {'strict', 'lenient', 'off'}
+        Raise a ``FITCRCError``, issue a warning, or don't check at all.
+    """
+    if mode not in CRC_MODES:
+        raise ValueError('crc should be one of %r' % (CRC_MODES,))
+    if mode == 'off':
+        return
+
+    buffer = fitfile.buffer
+    header_start = fitfile.data_start - fitfile.header_size
+    data_stop = fitfile.data_start + fitfile.data_size
+    problems = []
+
+    if fitfile.header_size >= 14:
+        header_crc, = unpack_from('<H', buffer, header_start + 12)
+        # A zero header CRC means it wasn't computed.
+        if header_crc and header_crc != crc16(buffer, header_start,
+                                               header_start + 12):
+            problems.append('header CRC mismatch')
+
+    if data_stop + 2 > len(buffer):
+        problems.append('file is truncated')
+    else:
+        file_crc, = unpack_from('<H', buffer, data_stop)
+        if file_crc != crc16(buffer, header_start, data_stop):
+            problems.append('file CRC mismatch')
+
+    if problems:
+        message = ', '.join(problems)
+        if mode == 'strict':
+            raise exceptions.FITCRCError(message)
+        warnings.warn(message, exceptions.FITCRCWarning)
+
+
 def read_fit_message(fitfile):
     """Parse a message (header + contents)."""
-    header_byte, = unpack('<B', fitfile.read(1))
+    header_byte = fitfile.read_byte()
     # A value of 0 in bit 7 indicates that this is a normal header.
     header_cls = (CompressedTimestampHeader if (header_byte & 0x80) else
                   NormalHeader)
@@ -418,18 +839,391 @@ def read_fit_message(fitfile):
 
 
 @contextmanager
-def open_fit(file_path):
-    reader = open(file_path, 'rb')
-    yield FitFile(reader)
-    reader.close()
+def open_fit(source):
+    """Open a *.fit file for decoding.
+
+    `source` can be a path, in which case the file is memory-mapped, a
+    bytes-like object that is decoded without copying, or a binary file
+    object, which is read (from its current position) into memory.
+    """
+    source = fit_source(source)
+    if is_contents(source):
+        yield FitFile(memoryview(source).cast('B'))
+        return
+
+    with map_file(source) as buffer:
+        yield FitFile(buffer)
+
+
+def fit_source(source):
+    """`source`, having read file objects into memory.
+
+    Anything needing more than one pass over a file (e.g. indexing it, then
+    decoding parts of it) should call this first.
+    """
+    return source.read() if is_file_object(source) else source
+
+
+@contextmanager
+def map_file(file_path):
+    """Memory-map a file for reading, closing the map afterwards.
+
+    Empty files can't be mapped, so these give an empty ``bytes``.
+    """
+    with open(file_path, 'rb') as reader:
+        try:
+            buffer = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            buffer = b''
+        try:
+            yield buffer
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+
+def compile_layout(endian, field_defs):
+    """Compile the data message layout described by `field_defs`.
+
+    Returns
+    -------
+    struct.Struct, [(field_def, index, invalid, parse), ...]
+        Integer fields are only compared against their `invalid` value,
+        saving a function call per value; anything else is checked (and
+        converted) by `parse`. Fields that unpack to zero values (i.e. are
+        smaller than their base type) are skipped over entirely. Array fields
+        unpack to several values, so their index is a slice.
+    """
+    codes, decoders, index = [endian], [], 0
+    for field_def in field_defs:
+        code, count = field_def.layout
+        codes.append(code)
+        if field_def.is_dynamic:
+            decoders.append((field_def, index, None, keep_raw))
+        elif count == 1:
+            base_type = field_def.base_type
+            if base_type.fmt in 'sfd':
+                decoders.append((field_def, index, None, field_def.parse))
+            else:
+                decoders.append((field_def, index, base_type.invalid, None))
+        elif count:
+            decoders.append((field_def, slice(index, index + count), None,
+                             field_def.parse_array))
+        index += count
+    return Struct(''.join(codes)), decoders
+
+
+def index_subfields(field_defs, decoders):
+    """Build the `subfield_index` of each dynamic field definition.
+
+    Reference values in the profile are names (e.g. 'timer'), so these are
+    mapped back to raw codes using the reference field's enum. Resolving a
+    subfield for a data message is then a dict lookup on its raw values.
+    """
+    value_index = {field_def.name: i for field_def, i, *__ in decoders}
+    profiles = {field_def.name: field_def.profile for field_def in field_defs}
+
+    for field_def in field_defs:
+        if not field_def.is_dynamic:
+            continue
+
+        index = {}   # by reference field name
+        for subfield in field_def.profile.subfields:
+            ref_name = subfield.ref_field_name
+            if ref_name not in value_index:
+                continue
+            enum = profiles[ref_name].enum or EMPTY_DICT
+            codes = {name: code for code, name in enum.items()}
+            bound = field_def.bind(subfield)
+            subfields = index.setdefault(ref_name, {})
+            for ref_value in subfield.ref_field_values:
+                try:
+                    code = int(codes.get(ref_value, ref_value))
+                except ValueError:
+                    continue
+                subfields[code] = bound
+
+        field_def.subfield_index = tuple(
+            (value_index[ref_name], subfields)
+            for ref_name, subfields in index.items())
+
+
+def index_components(field_defs, message_fields):
+    """Build the `component_index` of field definitions (and subfields).
+
+    Components are packed one after another from the least significant bit.
+    Each gets a definition of its own, carrying its scale/offset and units.
+    Components whose destination field is already in the message are left
+    out, rather than producing it twice.
+    """
+    present = {field_def.name for field_def in field_defs}
+    by_name = {profile.name: profile for profile in message_fields.values()}
+
+    def build(field_def):
+        index, shift = [], 0
+        for component in field_def.profile.components:
+            if component.name not in present:
+                target = by_name.get(component.name, UNKNOWN_FIELD)
+                profile = FieldProfile(
+                    target.number, component.name, target.type,
+                    component.units, component.scale, component.offset,
+                    False, None, (), (), None, frozenset())
+                index.append((shift, (1 << component.bits) - 1,
+                              field_def.bind(profile), component.accumulate))
+            shift += component.bits
+        return tuple(index)
+
+    for field_def in field_defs:
+        field_def.component_index = build(field_def)
+        for __, subfields in field_def.subfield_index:
+            for subfield in subfields.values():
+                subfield.component_index = build(subfield)
+
+
+def enum_categories(enum):
+    """Categories for the codes of an enum (from ``TYPES_INFO``).
+
+    Returns
+    -------
+    names : list
+        The distinct names of the enum, in code order.
+    positions : dict
+        Position of each code's name in `names`, by code.
+    """
+    names = list(dict.fromkeys(name for __, name in sorted(enum.items())))
+    index = {name: i for i, name in enumerate(names)}
+    return names, {int(code): index[name] for code, name in enum.items()}
+
+
+def keep_raw(value):
+    """Dynamic fields are parsed later, once their subfield is resolved."""
+    return value
+
+
+def count_run(fitfile, header_byte, stride, mask=0xFF):
+    """Count data messages with the same `header_byte` from the current offset.
+
+    Header bytes are first checked one by one, so short runs are cheap to
+    rule out, then in growing windows using a strided view of the buffer.
+    Only the bits in `mask` are compared (compressed timestamp headers
+    differ in their time offset).
+    """
+    buffer, start = fitfile.buffer, fitfile.offset
+    limit = min(fitfile.bytes_left, len(buffer) - start) // stride
+    header_byte &= mask
+
+    for n in range(1, min(MIN_RUN_LENGTH, limit)):
+        if buffer[start + n*stride] & mask != header_byte:
+            return n
+
+    n, window = MIN_RUN_LENGTH, MIN_RUN_LENGTH
+    while n < limit:
+        stop = min(n + window, limit)
+        headers = np.frombuffer(buffer, dtype=np.uint8,
+                                count=(stop - n - 1)*stride + 1,
+                                offset=start + n*stride)[::stride]
+        mismatch = np.flatnonzero(headers & mask != header_byte)
+        if mismatch.size:
+            return n + int(mismatch[0])
+        n, window = stop, 2 * window
 
+    return min(n, limit)
 
-def is_dynamic(field_def, field_value=None):
-    """Implements two checks for a dynamic field defintion."""
-    if field_value is not None:
-        return field_def.is_dynamic and isinstance(field_value, bytes)
+
+def read_data_run(fitfile):
+    """Read a run of data messages if one starts at the current offset.
+
+    Returns ``None`` (without moving through the file) if the next message
+    isn't the start of a long enough run of same-definition data messages.
+    """
+    header_byte = fitfile.buffer[fitfile.offset]
+    if header_byte & 0x80:
+        header, mask = CompressedTimestampHeader(header_byte), 0xE0
+    elif header_byte & 0x40:   # definition message
+        return None
     else:
-        return field_def.is_dynamic
+        header, mask = NormalHeader(header_byte), 0xFF
+
+    def_message = fitfile.local_messages.get(header.local_message_type)
+    if (def_message is None or def_message.has_dynamic
+            or def_message.name in DEVELOPER_MESSAGES):
+        return None
+
+    count = count_run(fitfile, header_byte, 1 + def_message.struct.size, mask)
+    if count < MIN_RUN_LENGTH:
+        return None
+
+    return DataMessageRun(header, fitfile, count)
+
+
+def skip_data_messages(fitfile, keep):
+    """Skip over data messages that aren't named in `keep`.
+
+    Uses the known size of the associated definition, so nothing is read
+    but header bytes; runs of the same message are skipped in one go.
+
+    Returns
+    -------
+    bool
+        Whether anything was skipped.
+    """
+    header_byte = fitfile.buffer[fitfile.offset]
+    compressed = header_byte & 0x80
+    if not compressed and header_byte & 0x40:   # definition message
+        return False
+
+    header = (CompressedTimestampHeader(header_byte) if compressed else
+              NormalHeader(header_byte))
+    def_message = fitfile.local_messages.get(header.local_message_type)
+    if (def_message is None or def_message.name in keep
+            or def_message.name in DEVELOPER_MESSAGES):
+        return False
+
+    stride = 1 + def_message.struct.size
+    count = 1 if compressed else count_run(fitfile, header_byte, stride)
+    if not count:   # not all there (i.e. a truncated file)
+        return False
+
+    # Keep track of time for any compressed timestamps still to come.
+    if compressed:
+        if fitfile.last_timestamp is not None:
+            fitfile.last_timestamp = compressed_timestamp(
+                fitfile.last_timestamp, header.time_offset)
+    elif def_message.timestamp_field is not None:
+        last = fitfile.offset + (count - 1)*stride + 1
+        values = def_message.struct.unpack_from(fitfile.buffer, last)
+        __, i, *__ = def_message.decoders[def_message.timestamp_field]
+        timestamp = values[i]
+        if timestamp != INVALID_TIMESTAMP:
+            fitfile.last_timestamp = timestamp
+
+    fitfile.skip_bytes(count * stride)
+    return True
+
+
+def compressed_timestamp(last_timestamp, time_offset):
+    """From the FIT SDK release 20.03.00
+
+    The time offset is the least significant 5 bits of the timestamp, so it
+    rolls over every 32 seconds relative to the last full timestamp.
+    """
+    return last_timestamp + ((time_offset - last_timestamp) & 0x1F)
+
+
+def compressed_timestamps(last_timestamp, time_offsets):
+    """Vectorised `compressed_timestamp` for consecutive messages."""
+    time_offsets = np.asarray(time_offsets, dtype=np.int64)
+    previous = np.concatenate(([last_timestamp & 0x1F], time_offsets[:-1]))
+    return last_timestamp + np.cumsum((time_offsets - previous) & 0x1F)
+
+
+def valid_mask(base_type, raw):
+    """Mask of the valid values in a numeric column, checked in one go."""
+    if raw.dtype.kind == 'f':
+        return ~np.isnan(raw)
+    return raw != base_type.invalid
+
+
+def decode_column(field_def, raw, enum_codes=False):
+    """Decode a column of raw values the same way ``DataMessage`` would
+    (see ``DataMessage.decode`` for `enum_codes`).
+
+    Array fields give two dimensional columns (a row per message), with
+    invalid elements masked out individually---except for byte arrays,
+    which are only invalid as a whole.
+
+    Returns ``None`` if every value is invalid.
+    """
+    if raw.dtype.kind == 'S':
+        values = np.array([value.split(b'\x00')[0] or None
+                           for value in raw.tolist()], dtype=object)
+        valid = np.not_equal(values, None)
+        if not valid.any():
+            return None
+        values[~valid] = np.nan
+        return values
+
+    valid = valid_mask(field_def.base_type, raw)
+    if not valid.any():
+        return None
+    if raw.ndim > 1 and field_def.base_type.name == 'byte':
+        valid = np.repeat(valid.any(axis=1, keepdims=True), raw.shape[1],
+                          axis=1)
+
+    enum = field_def.profile.enum
+    if enum_codes and field_def.is_enum:
+        values = raw.astype(np.float64)
+    elif enum is not None:
+        codes, inverse = np.unique(raw, return_inverse=True)
+        lookup = np.array([enum.get(code, code) for code in codes.tolist()],
+                          dtype=object)
+        values = lookup[inverse].reshape(raw.shape)
+    else:
+        values = apply_scale_offset(field_def, raw.astype(np.float64))
+
+    values[~valid] = np.nan
+    return values
+
+
+def decode_components(field_def, raw):
+    """Column-wise component expansion, for a column of `raw` field values.
+
+    Returns
+    -------
+    [(name, values, units), (name, values, units), ...]
+    """
+    valid = valid_mask(field_def.base_type, raw)
+    if raw.ndim > 1:   # join array elements, least significant first
+        width = 8 * field_def.base_type.size
+        bits = np.zeros(len(raw), dtype=np.uint64)
+        for k in range(raw.shape[1]):
+            bits |= raw[:, k].astype(np.uint64) << np.uint64(k * width)
+        valid = valid.any(axis=1)   # only invalid as a whole
+    else:
+        bits = raw.astype(np.uint64)
+    invalid = ~valid
+
+    columns = []
+    for shift, mask, component_def, __ in field_def.component_index:
+        values = (bits >> np.uint64(shift)) & np.uint64(mask)
+        values = apply_scale_offset(component_def, values.astype(np.float64))
+        values[invalid] = np.nan
+        columns.append((component_def.name, values,
+                        component_def.profile.units))
+    return columns
+
+
+def unwrap_accumulated(values, period, last=None, wrapped=None):
+    """Undo the rollover of an accumulated field, for a whole column.
+
+    From the FIT SDK release 20.03.00, accumulated fields only carry the low
+    bits of a running total; each value adds its difference from the last
+    (modulo the rollover `period`) to that total. Here the differences are
+    taken all at once and summed cumulatively. Invalid (NaN) values are
+    ignored, and stay NaN.
+
+    The total starts from the first value, or continues from the `last`
+    (unwrapped) value of an earlier column. If only some of the `values`
+    were `wrapped` (a boolean mask), the others hold the whole field, which
+    the total is reset to (as the SDK does).
+    """
+    valid = ~np.isnan(values)
+    raw = values[valid]
+    if not raw.size:
+        return values
+
+    first = raw[0] if last is None else last + (raw[0] - last) % period
+    totals = np.cumsum(np.concatenate(([first], np.diff(raw) % period)))
+
+    if wrapped is not None:
+        resets = ~wrapped[valid]
+        starts = np.flatnonzero(resets)
+        offsets = np.concatenate(([0], totals[starts] - raw[starts]))
+        totals -= offsets[np.cumsum(resets)]
+
+    unwrapped = values.copy()
+    unwrapped[valid] = totals
+    return unwrapped
 
 
 def apply_scale_offset(field_def, field_value):
@@ -443,43 +1237,50 @@ def apply_scale_offset(field_def, field_value):
     is divided by the scale factor and then the offset is subtracted, yielding
     a floating point quantity.
     """
-    scale = field_def.data.get('scale', 1)
-    offset = field_def.data.get('offset', 0)
-    return field_value / scale - offset
-
+    profile = field_def.profile
+    return field_value / profile.scale - profile.offset
 
-def which_one(iterable):
-    """Index of the first True value in an iterable."""
-    it = enumerate(iterable)
-    i, x = next(it)
-    while not x:
-        i, x = next(it)
-    return i
 
-
-def single_from(iterable):
-    """Check that an iterable contains one unique value, and return it."""
-    unique_vals = set(iterable)
-    if len(unique_vals) != 1:
-        raise ValueError('multiple unique values found')
-    return unique_vals.pop()
-
-
-def gen_fit_messages(file_path):
+def gen_fit_messages(source, *, runs=False, keep=None, crc='off'):
     """Generator function for iterating over *.fit file messages.
 
     Parameters
     ----------
-    file_path : str
-        Path to the ANT/Garmin fit file.
+    source : str, bytes-like or file object
+        Path to the ANT/Garmin fit file, its contents (``bytes``,
+        ``bytearray`` or ``memoryview``), or a binary file object.
+    runs : bool, optional
+        Yield runs of same-definition data messages as a single
+        ``DataMessageRun``, decoded in bulk.
+    keep : set of str, optional
+        Global message names (e.g. ``{'session', 'lap'}``) of the data
+        messages to decode. Others are skipped without being read.
+        Definition messages are always yielded, as are the data messages
+        describing developer fields.
+    crc : {'off', 'lenient', 'strict'}, optional
+        Check the header and file CRCs before decoding anything, warning or
+        raising a ``FITCRCError`` if they don't match.
 
     Yields
     ------
-    DefintionMessage or DataMessage
-        Parsed messages from `file_path`.
+    DefintionMessage, DataMessage or DataMessageRun
+        Parsed messages from `source`, including any files chained on to the
+        end of it (each is checked and decoded separately, in turn).
     """
-    with open_fit(file_path) as fitfile:
-        read_file_header(fitfile)       # inplace changes
+    with open_fit(source) as fitfile:
+        while True:
+            read_file_header(fitfile)       # inplace changes
+            check_crc(fitfile, crc)
 
-        while fitfile.bytes_left > 2:   # 2 byte CRC at the end of the file
-            yield read_fit_message(fitfile)
+            while fitfile.bytes_left > 0:   # `data_size` excludes the CRC
+                if keep is not None and skip_data_messages(fitfile, keep):
+                    continue
+                if runs:
+                    run = read_data_run(fitfile)
+                    if run is not None:
+                        yield run
+                        continue
+                yield read_fit_message(fitfile)
+
+            if not next_segment(fitfile):
+                break
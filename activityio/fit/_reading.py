@@ -6,17 +6,25 @@ this package's API.
 
 """
 from datetime import datetime, timedelta
+from itertools import chain
 
-import pytz
+import numpy as np
+from pandas import (
+    Categorical, DataFrame, DatetimeIndex, Timestamp, concat, to_timedelta)
 
-from activityio.fit._protocol import gen_fit_messages, DataMessage
+from activityio.fit._columnar import MessageColumns
+from activityio.fit._index import (
+    build_index, gen_indexed_messages, load_index)
+from activityio.fit._protocol import (
+    gen_fit_messages, DefinitionMessage, DataMessage, DataMessageRun,
+    enum_categories, fit_source, unwrap_accumulated)
 from activityio._types import ActivityData, special_columns
 from activityio._util import drydoc
+from activityio._util.sources import is_path
 
 
-TZ_UTC = pytz.timezone('UTC')
-
 DATETIME_1990 = datetime(year=1989, month=12, day=31)
+FIT_EPOCH = np.datetime64(DATETIME_1990, 'ns')
 
 COLUMN_SPEC = {     # see Profile.xlsx for expected column names
     'altitude_m': special_columns.Altitude,
@@ -31,8 +39,21 @@ COLUMN_SPEC = {     # see Profile.xlsx for expected column names
 }
 
 
-def message_filter(message, keep=('record', 'lap')):
-    return isinstance(message, DataMessage) and message.name in keep
+KEEP = frozenset({'record', 'lap'})
+
+# Records first decoded (then doubled) looking back from a window for the
+# totals of accumulated columns.
+CARRY_BLOCK = 1024
+
+# Messages packing several samples into array fields.
+HIGH_RATE = frozenset({'hrv', 'accelerometer_data', 'gyroscope_data',
+                       'magnetometer_data'})
+SAMPLE_TIME_KEYS = ('timestamp_s', 'timestamp_ms_ms', 'sample_time_offset_ms')
+
+
+def message_filter(message, keep=KEEP):
+    return (isinstance(message, (DataMessage, DataMessageRun))
+            and message.name in keep)
 
 
 def make_key(field):
@@ -57,7 +78,8 @@ def format_message(message):
 
 @drydoc.gen_records
 def gen_records(file_path):
-    messages = filter(message_filter, gen_fit_messages(file_path))
+    # NOTE: `file_path` can also be the file contents (bytes-like).
+    messages = filter(message_filter, gen_fit_messages(file_path, keep=KEEP))
     lap = 1
     for name, message in (format_message(message) for message in messages):
         if name == 'lap':
@@ -67,21 +89,260 @@ def gen_records(file_path):
             yield message
 
 
-def read_and_format(file_path, *, tz_str=None):
-    data = ActivityData.from_records(gen_records(file_path))
+def read_record_columns(file_path, *, crc='off'):
+    """Columnar equivalent of `gen_records`.
+
+    See `collect_record_columns` for what's returned.
+    """
+    messages = gen_fit_messages(file_path, runs=True, keep=KEEP, crc=crc)
+    return collect_record_columns(messages)
+
+
+def collect_record_columns(messages, definitions=()):
+    """Collect record columns (and lap information) from decoded `messages`.
+
+    `definitions` are any definition messages already in effect, e.g. when
+    carrying on from part way through a file.
+
+    Returns
+    -------
+    records : MessageColumns
+        Decoded record messages, with the categories of enum columns.
+    lap_starts : list
+        Number of records seen when each lap message was encountered.
+    accumulated : dict
+        (period, ranges) of accumulated record columns, by column key: the
+        rollover period, and the [start, stop) ranges of records holding
+        wrapped values. These are left wrapped, as they are in `gen_records`;
+        other records hold the whole value.
+    """
+    columns, lap_starts, accumulated = collect_columns(
+        messages, definitions, names={'record'})
+    return columns.get('record', MessageColumns()), lap_starts, accumulated
+
+
+def collect_columns(messages, definitions=(), *, names=None):
+    """Collect the columns of each type of data message in `messages`.
+
+    Parameters
+    ----------
+    messages : iterable
+        Decoded messages, as from `gen_fit_messages`.
+    definitions : iterable, optional
+        See `collect_record_columns`.
+    names : set, optional
+        Names of the messages to collect (all of them, by default). Lap
+        messages are counted either way.
+
+    Returns
+    -------
+    columns : dict
+        `MessageColumns` by message name.
+    lap_starts, accumulated
+        See `collect_record_columns`.
+    """
+    columns, lap_starts, accumulated = {}, [], {}
+    wrapping = {}   # accumulated record columns, by local message type
+
+    for message in chain(definitions, messages):
+        name = message.name
+        local_type = message.header.local_message_type
+        if isinstance(message, DefinitionMessage):
+            if names is None or name in names:
+                columns.setdefault(name, MessageColumns()).categories.update(
+                    (make_key(field), field[1]) for field in message.enums)
+            wrapped = message.accumulated if name == 'record' else []
+            wrapping[local_type] = [make_key(field) for field in wrapped]
+            for field in wrapped:
+                accumulated.setdefault(make_key(field), (field[1], []))
+            continue
+
+        is_run = isinstance(message, DataMessageRun)
+        n_messages = len(message) if is_run else 1
+        if name == 'lap':
+            n_records = len(columns['record']) if 'record' in columns else 0
+            lap_starts.extend([n_records] * n_messages)
+        if names is not None and name not in names:
+            continue
+
+        builder = columns.setdefault(name, MessageColumns())
+        start = len(builder)
+        for key in wrapping.get(local_type, ()):
+            ranges = accumulated[key][1]
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1] += n_messages
+            else:
+                ranges.append([start, start + n_messages])
+        if is_run:
+            builder.extend(len(message),
+                           ((make_key(column), column[1]) for column
+                            in message.decode_columns(enum_codes=True)))
+        else:
+            builder.append((make_key(field), field[1])
+                           for field in message.decode(enum_codes=True))
+
+    return columns, lap_starts, accumulated
+
+
+def read_and_format(file_path, *, tz_str=None, crc='off'):
+    return format_record_columns(*read_record_columns(file_path, crc=crc),
+                                 tz_str=tz_str)
+
+
+def read_all(file_path, *, tz_str=None, crc='off'):
+    """Read every type of data message, in a single pass.
+
+    Parameters
+    ----------
+    file_path : str, bytes-like or file object
+        Path to the fit file, its contents, or a binary file object.
+    tz_str : str, optional
+        Time zone of the returned timestamps (UTC by default).
+    crc : {'off', 'lenient', 'strict'}, optional
+        See `gen_fit_messages`.
+
+    Returns
+    -------
+    dict
+        Frames by message name (e.g. 'session', 'lap', 'event'). Records are
+        formatted as by `read_and_format`; see `format_message_columns` for
+        the rest. Messages the profile doesn't name are left out.
+    """
+    messages = gen_fit_messages(file_path, runs=True, crc=crc)
+    columns, lap_starts, accumulated = collect_columns(messages)
+    columns.pop('unknown', None)
+
+    frames = {}
+    for name, builder in columns.items():
+        if not len(builder):
+            continue
+        if name == 'record':
+            frames[name] = format_record_columns(
+                builder, lap_starts, accumulated, tz_str=tz_str)
+        else:
+            frames[name] = format_message_columns(builder, tz_str=tz_str)
+    return frames
+
+
+def read_window(file_path, start=None, stop=None, *, index=None,
+                save_index=False, tz_str=None):
+    """Like `read_and_format`, but only for the records timestamped within
+    [`start`, `stop`), which are found using a `MessageIndex`.
+
+    Parameters
+    ----------
+    file_path : str, bytes-like or file object
+        Path to the fit file, its contents, or a binary file object.
+    start, stop : datetime, optional
+        Bounds of the window (UTC).
+    index : MessageIndex, optional
+        Index of the file. By default, an index saved next to the file is
+        used if it's up to date; otherwise one is built.
+    save_index : bool, optional
+        Save an index that had to be built next to the file (see
+        `load_index`), for later reads.
+    tz_str : str, optional
+        Time zone of the returned timestamps (UTC by default).
+    """
+    file_path = fit_source(file_path)
+    index = get_index(file_path, index, save_index)
+    records = index.positions('record', fit_seconds(start), fit_seconds(stop))
+
+    # Laps are numbered by the lap messages before each record.
+    laps = index.positions('lap')
+    if records.size:
+        laps = laps[laps < records[-1]]
+
+    carried = {}
+    if records.size:
+        carried = carried_totals(file_path, index, records[0])
+
+    messages = gen_indexed_messages(file_path, index,
+                                    np.union1d(laps, records))
+    return format_record_columns(*collect_record_columns(messages),
+                                 tz_str=tz_str, carried=carried)
+
+
+def carried_totals(file_path, index, before):
+    """Last (unwrapped) values of accumulated record columns before the
+    record at position `before` in `index`, for `read_window` to continue.
+
+    Wrapped values only make sense relative to a running total, so earlier
+    records are decoded, in growing blocks, back to where each accumulated
+    column last held its whole value (or to the first record).
+    """
+    earlier = index.positions('record')
+    earlier = earlier[earlier < before]
+
+    n_records = min(CARRY_BLOCK, earlier.size)
+    while n_records:
+        first = earlier.size - n_records
+        messages = gen_indexed_messages(file_path, index, earlier[first:])
+        records, __, accumulated = collect_record_columns(messages)
+        columns, carried = records.to_dict(), {}
+        wrapped = unwrap_record_columns(columns, len(records), accumulated,
+                                        carried)
+        if not first or all(np.any(~np.isnan(columns[key]) & ~mask)
+                            for key, mask in wrapped.items()):
+            return carried
+        n_records = min(2 * n_records, earlier.size)
+    return {}
+
+
+def read_messages(file_path, name, *, index=None, save_index=False):
+    """Decode only the data messages called `name` (e.g. 'session'), which
+    are found using a `MessageIndex` (see `read_window` for `index` and
+    `save_index`).
+
+    Returns
+    -------
+    list of dict
+        Formatted like records, timestamps included.
+    """
+    file_path = fit_source(file_path)
+    index = get_index(file_path, index, save_index)
+    messages = gen_indexed_messages(file_path, index, index.positions(name),
+                                    runs=False)
+    return [format_message(message)[1] for message in messages
+            if isinstance(message, DataMessage) and message.name == name]
 
-    try:
-        del data['unknown']
-    except KeyError:
-        pass
 
-    if 'timestamp' in data:
-        timestamps = data.pop('timestamp')  # UTC
+def get_index(file_path, index=None, save=False):
+    if index is not None:
+        return index
+    if is_path(file_path):
+        return load_index(file_path, save=save)
+    return build_index(file_path)
 
-        timezone = pytz.timezone(tz_str) if tz_str is not None else TZ_UTC
-        tz_offset = timezone.utcoffset(timestamps[0])
-        timestamps += tz_offset
-        tstart = timestamps[0]
+
+def fit_seconds(timestamp):
+    """Raw FIT timestamp of a (UTC) datetime."""
+    if timestamp is None:
+        return None
+    return (timestamp - DATETIME_1990).total_seconds()
+
+
+def format_record_columns(records, lap_starts, accumulated, *, tz_str=None,
+                          first_lap=1, start=None, carried=None):
+    """`ActivityData` from the output of `collect_record_columns`.
+
+    When reading a file in chunks, laps can be numbered from `first_lap`,
+    time offsets measured from an earlier `start`, and accumulated columns
+    continued from their last (unwrapped) values in `carried`---which is
+    updated with the last values of this chunk.
+    """
+    columns = records.to_dict()
+    columns.pop('unknown', None)
+    categorize(columns, records.categories)
+    unwrap_record_columns(columns, len(records), accumulated, carried)
+    columns['lap'] = np.searchsorted(
+        lap_starts, np.arange(len(records)), side='right') + first_lap
+
+    data = ActivityData(columns)
+
+    if 'timestamp_s' in data and len(data):
+        timestamps = local_timestamps(data.pop('timestamp_s'), tz_str)
+        tstart = timestamps[0] if start is None else start
 
         timeoffsets = timestamps - tstart
         data._finish_up(column_spec=COLUMN_SPEC,
@@ -90,3 +351,184 @@ def read_and_format(file_path, *, tz_str=None):
         data._finish_up(column_spec=COLUMN_SPEC)
 
     return data
+
+
+def unwrap_record_columns(columns, n_records, accumulated, carried=None):
+    """Unwrap the accumulated columns of `columns` (a dict of record
+    columns) in place, continuing from and updating `carried` as in
+    `format_record_columns`.
+
+    Returns
+    -------
+    dict
+        Boolean masks of the records that held wrapped values, by key.
+    """
+    masks = {}
+    for key, (period, ranges) in accumulated.items():
+        if key in columns:
+            wrapped = masks[key] = np.zeros(n_records, dtype=bool)
+            for first, last in ranges:
+                wrapped[first:last] = True
+            columns[key] = unwrap_accumulated(
+                columns[key], period,
+                None if carried is None else carried.get(key), wrapped)
+            if carried is not None:
+                valid = columns[key][~np.isnan(columns[key])]
+                if valid.size:
+                    carried[key] = valid[-1]
+    return masks
+
+
+def format_message_columns(columns, *, tz_str=None):
+    """`DataFrame` with a row per message, from a `MessageColumns`.
+
+    Timestamps are converted to local times, in a 'timestamp' column (as in
+    `gen_records`). Array fields are left as an array per row; see
+    `read_high_rate` for flattening them.
+    """
+    data = columns.to_dict()
+    data.pop('unknown', None)
+    categorize(data, columns.categories)
+    if 'timestamp_s' in data:
+        data = {'timestamp': local_timestamps(data.pop('timestamp_s'),
+                                              tz_str), **data}
+    return DataFrame(data)
+
+
+def categorize(columns, categories):
+    """Turn the enum columns of `columns` (a dict) into categoricals, in
+    place, given their enums by key (see `MessageColumns`)."""
+    for key, enum in categories.items():
+        if key in columns:
+            columns[key] = enum_categorical(columns[key], enum)
+
+
+def enum_categorical(codes, enum):
+    """Enum `codes` (NaN where invalid) as a ``pandas.Categorical`` of the
+    names in `enum`, with every name it defines as a category.
+
+    Codes the profile doesn't name are given names like 'unknown_200',
+    added to the end of the categories.
+    """
+    names, positions = enum_categories(enum)
+    valid = ~np.isnan(codes)
+    present = np.unique(codes[valid]).astype(np.int64)
+
+    lookup = np.empty(len(present), dtype=np.int64)
+    for i, code in enumerate(present.tolist()):
+        if code not in positions:
+            positions[code] = len(names)
+            names.append('unknown_%d' % code)
+        lookup[i] = positions[code]
+
+    category_codes = np.full(len(codes), -1, dtype=np.int64)
+    category_codes[valid] = lookup[np.searchsorted(present, codes[valid])]
+    return Categorical.from_codes(category_codes, categories=names)
+
+
+def read_high_rate(file_path, message, *, tz_str=None, crc='off'):
+    """Read high rate data, flattened out to a row per sample.
+
+    Messages like 'hrv' and 'accelerometer_data' pack several samples into
+    array fields, which are decoded in bulk then flattened. Message level
+    fields (e.g. timestamps) are repeated for each of their samples.
+
+    Parameters
+    ----------
+    file_path : str, bytes-like or file object
+        Path to the fit file, its contents, or a binary file object.
+    message : {'hrv', 'accelerometer_data', 'gyroscope_data', \
+'magnetometer_data'}
+        Which samples to read.
+    tz_str : str, optional
+        Time zone of the returned timestamps (UTC by default).
+    crc : {'off', 'lenient', 'strict'}, optional
+        See `gen_fit_messages`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        For 'hrv', beat-to-beat intervals ('time_s') indexed by the time
+        elapsed since the first of them. Otherwise sensor readings indexed by
+        the time each was sampled.
+    """
+    if message not in HIGH_RATE:
+        raise ValueError('%r is not a high rate message' % message)
+
+    chunks = []
+    messages = gen_fit_messages(file_path, runs=True, keep={message}, crc=crc)
+    for msg in messages:
+        if isinstance(msg, DataMessageRun):
+            chunks.append(flatten_samples(len(msg), msg.decode_columns()))
+        elif isinstance(msg, DataMessage):
+            chunks.append(flatten_samples(1, msg.decode()))
+
+    if not chunks:
+        return DataFrame()
+    data = concat(chunks, ignore_index=True)
+    data = data.drop('unknown', axis=1, errors='ignore')
+
+    # Drop the padding at the end of partly filled arrays.
+    samples = [key for key in data if key not in SAMPLE_TIME_KEYS]
+    data = data.dropna(how='all', subset=samples).reset_index(drop=True)
+
+    if message == 'hrv':
+        data.index = to_timedelta(data['time_s'].cumsum().values, unit='s')
+    elif 'timestamp_s' in data:
+        seconds = data.pop('timestamp_s')
+        for key in SAMPLE_TIME_KEYS[1:]:
+            if key in data:
+                seconds += data.pop(key).fillna(0) / 1000
+        data.index = DatetimeIndex(local_timestamps(seconds, tz_str))
+
+    data.index.name = 'time'
+    return data
+
+
+def flatten_samples(n_messages, columns):
+    """Frame of `columns`, decoded from `n_messages` messages, with a row
+    per array element."""
+    columns = [(make_key(column),
+                np.asarray(column[1]).reshape(n_messages, -1))
+               for column in columns]
+    width = max(values.shape[1] for __, values in columns)
+
+    flat = {}
+    for key, values in columns:
+        if values.shape[1] == 1:   # repeat message level values
+            values = np.repeat(values, width, axis=1)
+        elif values.shape[1] < width:
+            padded = np.full((n_messages, width), np.nan, dtype=values.dtype)
+            padded[:, :values.shape[1]] = values
+            values = padded
+        flat[key] = values.ravel()
+    return DataFrame(flat)
+
+
+def fit_datetimes(seconds):
+    """UTC ``datetime64[ns]`` values of raw FIT timestamps (seconds since
+    the FIT epoch), converted in one go. Missing timestamps become NaT."""
+    nanoseconds = np.rint(np.asarray(seconds, dtype=np.float64) * 1e9)
+    missing = np.isnan(nanoseconds)
+    deltas = np.where(missing, 0, nanoseconds).astype('timedelta64[ns]')
+    deltas[missing] = np.timedelta64('NaT')
+    return FIT_EPOCH + deltas
+
+
+def local_timestamps(seconds, tz_str=None):
+    """Naive local timestamps from raw FIT timestamps (see `fit_datetimes`).
+
+    A single UTC offset, taken at the first (valid) timestamp, is applied to
+    all of them.
+    """
+    timestamps = DatetimeIndex(fit_datetimes(seconds))
+    valid = timestamps[timestamps.notna()]
+    if tz_str is None or not len(valid):
+        return timestamps
+    return timestamps + utc_offset(valid[0], tz_str)
+
+
+def utc_offset(timestamp, tz_str):
+    """UTC offset of the `tz_str` time zone at a (naive, UTC) `timestamp`."""
+    return Timestamp(timestamp).tz_localize('UTC').tz_convert(
+        tz_str).utcoffset()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Summarise *.fit files without reading their records.
+
+Listing activities only needs the 'file_id' and 'session' messages, and when
+the records start and stop. Everything else is skipped over using the sizes
+of the definitions, without unpacking it; only the first (timestamped) record
+is decoded, and the time of the last is picked out of the last message of
+each run. As the file is memory mapped, the pages skipped over aren't even
+read.
+
+"""
+from datetime import timedelta
+
+from activityio.fit._protocol import (
+    TIMESTAMP_FIELD_NUM, DataMessage, next_segment, open_fit,
+    read_file_header, read_fit_message, skip_data_messages)
+from activityio.fit._reading import DATETIME_1990, format_message
+
+
+SUMMARY_MESSAGES = frozenset({'file_id', 'session'})
+
+
+class FitSummary:
+    """What's needed to list an activity.
+
+    Attributes
+    ----------
+    file_id : dict
+        The 'file_id' message (e.g. its manufacturer and product), formatted
+        like records. Empty if there isn't one.
+    sessions : list of dict
+        'session' messages (with totals), formatted likewise.
+    start, end : datetime
+        Times (UTC) of the first and last records, or None if there aren't
+        any.
+    """
+    __slots__ = ('file_id', 'sessions', 'start', 'end')
+
+    def __init__(self, file_id, sessions, start, end):
+        self.file_id, self.sessions = file_id, sessions
+        self.start, self.end = start, end
+
+    def __repr__(self):
+        return '<FitSummary: %d session(s) from %s to %s>' % (
+            len(self.sessions), self.start, self.end)
+
+    @property
+    def duration(self):
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+
+def read_summary(file_path):
+    """Read a `FitSummary` of a *.fit file.
+
+    Parameters
+    ----------
+    file_path : str, bytes-like or file object
+        Path to the fit file, its contents, or a binary file object.
+    """
+    file_id, sessions = {}, []
+    first = last = None
+
+    with open_fit(file_path) as fitfile:
+        while True:
+            read_file_header(fitfile)
+
+            while fitfile.bytes_left > 0:
+                compressed = fitfile.buffer[fitfile.offset] & 0x80
+                def_message = next_definition(fitfile)
+                is_record = (def_message is not None
+                             and def_message.name == 'record')
+                # Otherwise, the last timestamp is some other message's.
+                is_timed = is_record and (
+                    compressed or def_message.timestamp_field is not None)
+
+                if is_timed and first is None:
+                    first = message_timestamp(read_fit_message(fitfile))
+                elif not skip_data_messages(fitfile, SUMMARY_MESSAGES):
+                    message = read_fit_message(fitfile)
+                    if isinstance(message, DataMessage):
+                        name, formatted = format_message(message)
+                        if name == 'file_id':
+                            file_id = formatted
+                        elif name == 'session':
+                            sessions.append(formatted)
+
+                if is_timed and first is not None:
+                    last = fitfile.last_timestamp
+
+            if not next_segment(fitfile):
+                break
+
+    return FitSummary(file_id, sessions, fit_datetime(first),
+                      fit_datetime(last))
+
+
+def next_definition(fitfile):
+    """Definition of the data message at the current offset (None if it's
+    a definition message itself)."""
+    header_byte = fitfile.buffer[fitfile.offset]
+    if header_byte & 0x80:   # compressed timestamp header
+        return fitfile.local_messages.get(header_byte >> 5 & 0x3)
+    elif header_byte & 0x40:
+        return None
+    return fitfile.local_messages.get(header_byte & 0xF)
+
+
+def message_timestamp(message):
+    """Raw timestamp of a decoded data message (None if it has no valid
+    one)."""
+    for field_def, value in zip(message.field_defs, message.field_values):
+        if field_def.number == TIMESTAMP_FIELD_NUM:
+            return value
+    return None
+
+
+def fit_datetime(timestamp):
+    if timestamp is None:
+        return None
+    return DATETIME_1990 + timedelta(seconds=timestamp)
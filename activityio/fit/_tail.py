@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Follow *.fit files that are still being written.
+
+Devices sync activities part way through, so the same file turns up again
+and again, a little longer each time. Rather than decoding it from the
+start every time, a `TailReader` keeps the decoder state (definitions,
+developer fields, the last timestamp, ...) between reads and carries on
+from the last complete message.
+
+"""
+from struct import error as StructError, unpack_from
+
+from activityio.fit._columnar import MessageColumns
+from activityio.fit._protocol import (
+    FitFile, map_file, read_data_run, read_file_header, read_fit_message,
+    skip_data_messages)
+from activityio.fit._reading import (
+    KEEP, collect_record_columns, format_record_columns)
+
+
+class TailReader:
+    """Read the records of a growing *.fit file, a chunk at a time.
+
+    Attributes
+    ----------
+    file_path : str
+        Path to the fit file.
+    tz_str : str
+        Time zone of timestamps (UTC if None).
+    fitfile : FitFile
+        Decoder state, once the file header has been read.
+    n_laps : int
+        Lap messages read so far.
+    start : datetime
+        Time of the first record, which chunks are indexed from.
+    carried : dict
+        Last values of accumulated columns, so they continue between chunks.
+    """
+    __slots__ = ('file_path', 'tz_str', 'fitfile', 'n_laps', 'start',
+                 'carried')
+
+    def __init__(self, file_path, *, tz_str=None):
+        self.file_path = file_path
+        self.tz_str = tz_str
+        self.fitfile = None
+        self.n_laps = 0
+        self.start = None
+        self.carried = {}
+
+    @property
+    def offset(self):
+        """Offset of the first message not read yet."""
+        return 0 if self.fitfile is None else self.fitfile.offset
+
+    def read(self):
+        """Records added since the last read (possibly none).
+
+        Returns
+        -------
+        ActivityData
+            Indexed by time since the first record of the file, with laps
+            (and any accumulated columns) continuing from earlier chunks.
+        """
+        with map_file(self.file_path) as buffer:
+            fitfile = self._resume(buffer)
+            if fitfile is None:
+                records, lap_starts, accumulated = MessageColumns(), [], {}
+            else:
+                try:
+                    records, lap_starts, accumulated = collect_record_columns(
+                        gen_complete_messages(fitfile),
+                        list(fitfile.local_messages.values()))
+                finally:
+                    fitfile.buffer = b''   # the map is about to be closed
+
+        data = format_record_columns(
+            records, lap_starts, accumulated, tz_str=self.tz_str,
+            first_lap=self.n_laps + 1, start=self.start,
+            carried=self.carried)
+
+        self.n_laps += len(lap_starts)
+        if self.start is None:
+            self.start = data.start
+        return data
+
+    def _resume(self, buffer):
+        """Point the decoder at the current contents of the file.
+
+        Returns ``None`` if the file header hasn't been written yet.
+        """
+        fitfile = self.fitfile
+        if fitfile is None:
+            if len(buffer) < 12 or len(buffer) < buffer[0]:
+                return None
+            fitfile = self.fitfile = FitFile(buffer)
+            read_file_header(fitfile)
+        fitfile.buffer = buffer
+
+        # The header's data size is usually only filled in once the file is
+        # finished; until then, read whatever is there.
+        data_size, = unpack_from('<I', buffer, 4)
+        data_end = fitfile.data_start + data_size
+        if not data_size or data_end > len(buffer):
+            data_end = len(buffer)
+        fitfile.bytes_left = data_end - fitfile.offset
+        return fitfile
+
+
+def gen_complete_messages(fitfile):
+    """Like ``gen_fit_messages`` (with runs, keeping records and laps) from
+    the current offset of `fitfile`, but stopping at the start of the first
+    message that hasn't been completely written yet."""
+    while fitfile.bytes_left > 0:
+        start = fitfile.offset
+        try:
+            if skip_data_messages(fitfile, KEEP):
+                message = None
+            else:
+                message = read_data_run(fitfile)
+                if message is None:
+                    message = read_fit_message(fitfile)
+        except (StructError, IndexError):   # ran out of buffer
+            fitfile.seek(start)
+            return
+
+        if fitfile.bytes_left < 0:   # skipped past the end
+            fitfile.seek(start)
+            return
+        if message is not None:
+            yield message
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Encode `ActivityData` as a *.fit (activity) file.
+
+Records are written under a single definition message. Rather than packing
+them one at a time, each column is converted to raw FIT values in one go and
+written into a NumPy structured array laid out exactly like the data
+messages, which is then dumped straight into the file. Laps, the session and
+the activity are encoded the same way, with totals worked out from the
+records.
+
+"""
+import re
+import struct
+
+import numpy as np
+from pandas import Categorical, Timestamp
+
+from activityio.fit._crc import crc16
+from activityio.fit._profile import (
+    BASE_TYPES_BY_NAME, GLOBAL_MESG_NUMS, MESSAGE_FIELDS)
+from activityio.fit._protocol import TIMESTAMP_FIELD_NUM, enum_categories
+from activityio.fit._reading import (
+    COLUMN_SPEC, FIT_EPOCH, make_key)
+
+
+PROTOCOL_VERSION = 0x10   # 1.0, nothing written needs anything newer
+PROFILE_VERSION = 2003    # SDK release 20.03, as the profile
+
+FILE_HEADER = struct.Struct('<2BHI4s')
+
+MESG_NUMS = {name: int(number) for number, name in GLOBAL_MESG_NUMS.items()}
+
+# Local message types.
+FILE_ID, RECORD, LAP, SESSION, ACTIVITY = range(5)
+
+FILE_ACTIVITY = 4          # file_id.type
+MANUFACTURER_DEV = 255     # file_id.manufacturer, i.e. 'development'
+ACTIVITY_MANUAL = 0        # activity.type
+EVENT_SESSION, EVENT_LAP, EVENT_ACTIVITY = 8, 9, 26
+EVENT_TYPE_STOP = 1
+
+UINT32 = BASE_TYPES_BY_NAME['uint32']
+
+# Base types of the profile's named types that can't be told from the
+# profile data, which only keeps their values (see `field_base_type`).
+NAMED_BASE_TYPES = {
+    'activity': 'enum', 'date_time': 'uint32', 'local_date_time': 'uint32',
+    'device_index': 'uint8', 'message_index': 'uint16',
+    'left_right_balance': 'uint8', 'left_right_balance_100': 'uint16',
+}
+
+UNKNOWN_CODE = re.compile(r'unknown_(\d+)$')   # see `enum_categorical`
+
+# Special column names back to the record keys they were read from.
+RECORD_KEYS = {getattr(column_cls, '__self__', column_cls).colname: key
+               for key, column_cls in COLUMN_SPEC.items()}
+
+DEGREES_TO_SEMICIRCLES = 2**31 / 180
+
+
+def write(data, file_path, *, tz_str=None):
+    """Write `data` to a *.fit activity file.
+
+    Columns are matched to record fields by their names (as returned by
+    `read`); anything else, besides 'lap', isn't written. Enum fields can be
+    categorical, as read. A lap message is written at the end of each lap,
+    and a session and an activity message at the end of the file, with
+    their times and distance totalled from the records (there's nothing to
+    tell timer time apart from elapsed time, so they're the same).
+
+    Parameters
+    ----------
+    data : ActivityData
+        Must have a start time and a time index.
+    file_path : str
+        Where to write the file.
+    tz_str : str, optional
+        Time zone of the `data` timestamps (UTC by default).
+    """
+    with open(file_path, 'wb') as fit_file:
+        fit_file.write(encode(data, tz_str=tz_str))
+
+
+def encode(data, *, tz_str=None):
+    """Contents of the *.fit file written by `write`."""
+    timestamps = fit_timestamps(data, tz_str)
+    fields = record_fields(data)
+    all_fields = message_fields('record', {'timestamp': timestamps}) + fields
+    records = encode_messages(RECORD, all_fields, len(timestamps))
+
+    time_created = records['timestamp'][0] if len(records) else 0
+    chunks = [
+        definition_message(FILE_ID, 'file_id', [
+            (0, BASE_TYPES_BY_NAME['enum']),
+            (1, BASE_TYPES_BY_NAME['uint16']), (4, UINT32)]),
+        struct.pack('<2BHI', FILE_ID, FILE_ACTIVITY, MANUFACTURER_DEV,
+                    time_created),
+        definition_message(RECORD, 'record', fields_layout(all_fields)),
+    ]
+    if not len(records):
+        return file_contents(chunks)
+
+    laps = data['lap'].values if 'lap' in data else np.ones(len(records))
+    stops = np.append(np.flatnonzero(np.diff(laps)) + 1, len(records))
+    starts = np.append(0, stops[:-1])
+
+    distance = next((values for profile, __, values in fields
+                     if profile.name == 'distance'), None)
+    if distance is not None:
+        distance = reached_distance(distance)
+
+    lap_fields = summary_fields('lap', timestamps, distance, starts, stops,
+                                event=EVENT_LAP, event_type=EVENT_TYPE_STOP)
+    chunks.append(definition_message(LAP, 'lap', fields_layout(lap_fields)))
+    lap_messages = encode_messages(LAP, lap_fields, len(stops))
+    for lap, (start, stop) in enumerate(zip(starts.tolist(),
+                                            stops.tolist())):
+        chunks.append(records[start:stop].tobytes())
+        chunks.append(lap_messages[lap:lap + 1].tobytes())
+
+    session_fields = summary_fields(
+        'session', timestamps, distance, starts[:1], stops[-1:],
+        event=EVENT_SESSION, event_type=EVENT_TYPE_STOP, first_lap_index=0,
+        num_laps=len(stops))
+    activity_fields = message_fields('activity', {
+        'timestamp': timestamps[-1],
+        'total_timer_time': timestamps[-1] - timestamps[0],
+        'num_sessions': 1, 'type': ACTIVITY_MANUAL, 'event': EVENT_ACTIVITY,
+        'event_type': EVENT_TYPE_STOP})
+    for local_type, name, summary in ((SESSION, 'session', session_fields),
+                                      (ACTIVITY, 'activity',
+                                       activity_fields)):
+        chunks.append(definition_message(local_type, name,
+                                         fields_layout(summary)))
+        chunks.append(encode_messages(local_type, summary, 1).tobytes())
+
+    return file_contents(chunks)
+
+
+def file_contents(chunks):
+    """Complete *.fit file of the messages in `chunks` (bytes)."""
+    body = b''.join(chunks)
+    header = FILE_HEADER.pack(14, PROTOCOL_VERSION, PROFILE_VERSION,
+                              len(body), b'.FIT')
+    contents = header + struct.pack('<H', crc16(header)) + body
+    return contents + struct.pack('<H', crc16(contents))
+
+
+def encode_messages(local_type, fields, count):
+    """`count` data messages of (FieldProfile, BaseType, values) `fields`,
+    as a structured array laid out exactly like them. Single values are
+    repeated."""
+    messages = np.empty(count, dtype=np.dtype(
+        [('header', 'u1')] + [(profile.name, '<' + base_type.fmt)
+                              for profile, base_type, __ in fields]))
+    messages['header'] = local_type
+    for profile, base_type, values in fields:
+        messages[profile.name] = encode_column(
+            np.broadcast_to(values, count), base_type, profile.scale,
+            profile.offset)
+    return messages
+
+
+def fields_layout(fields):
+    """(number, base type) of `fields`, for `definition_message`."""
+    return [(profile.number, base_type) for profile, base_type, __ in fields]
+
+
+def definition_message(local_type, name, fields):
+    """Little endian definition message for (number, base type) `fields`."""
+    return (struct.pack('<BxBHB', 0x40 | local_type, 0, MESG_NUMS[name],
+                        len(fields))
+            + b''.join(struct.pack('3B', number, base_type.size,
+                                   base_type.identifier)
+                       for number, base_type in fields))
+
+
+def fit_timestamps(data, tz_str=None):
+    """Raw FIT timestamps (UTC seconds) of the rows of `data`."""
+    if data.start is None:
+        raise ValueError('data has no start time')
+
+    start = Timestamp(data.start)
+    if tz_str is not None:   # undo `local_timestamps`
+        start = start.tz_localize(tz_str, ambiguous=False).tz_convert(
+            'UTC').tz_localize(None)
+    return ((start.to_datetime64() - FIT_EPOCH) / np.timedelta64(1, 's')
+            + data.time.total_seconds())
+
+
+def record_fields(data):
+    """(FieldProfile, BaseType, values) for the columns of `data` that are
+    record fields."""
+    profiles = {make_key((profile.name, None, profile.units)): profile
+                for profile in MESSAGE_FIELDS['record'].values()}
+
+    fields = []
+    for column in data:
+        profile = profiles.get(RECORD_KEYS.get(column, column))
+        if (profile is None or profile.number == TIMESTAMP_FIELD_NUM
+                or profile.is_array or profile.type in ('string', 'byte')):
+            continue
+        base_type = field_base_type(profile)
+        values = data[column].values
+        if isinstance(values, Categorical):
+            if profile.enum is None:
+                raise ValueError('%r is categorical, but %r is not an enum'
+                                 % (column, profile.name))
+            values = enum_codes(values, profile.enum)
+        if base_type is None:
+            raise ValueError('no base type for %r (of type %r)'
+                             % (column, profile.type))
+        if profile.units == 'semicircles':
+            values = values * DEGREES_TO_SEMICIRCLES
+        fields.append((profile, base_type, values))
+
+    return fields
+
+
+def message_fields(name, values):
+    """(FieldProfile, BaseType, values) for `values` of message `name`'s
+    fields, by field name."""
+    profiles = {profile.name: profile
+                for profile in MESSAGE_FIELDS[name].values()}
+    return [(profiles[key], field_base_type(profiles[key]), column)
+            for key, column in values.items()]
+
+
+def field_base_type(profile):
+    """The `BaseType` of a field, or None if it's not known."""
+    name = NAMED_BASE_TYPES.get(profile.type, profile.type)
+    if name in BASE_TYPES_BY_NAME:
+        return BASE_TYPES_BY_NAME[name]
+    if profile.enum is not None:
+        return BASE_TYPES_BY_NAME['enum']
+    return None
+
+
+def enum_codes(values, enum):
+    """Codes (NaN where missing) of a ``pandas.Categorical`` of `enum`
+    names, undoing `enum_categorical`."""
+    names, positions = enum_categories(enum)
+    codes = {}
+    for code, position in sorted(positions.items(), reverse=True):
+        codes[names[position]] = code   # the lowest, if names repeat
+
+    lookup = np.full(len(values.categories) + 1, np.nan)   # last for -1
+    for i, name in enumerate(values.categories):
+        unknown = UNKNOWN_CODE.match(str(name))
+        if name in codes:
+            lookup[i] = codes[name]
+        elif unknown:
+            lookup[i] = int(unknown.group(1))
+        else:
+            raise ValueError('%r has no code' % (name,))
+    return lookup[values.codes]
+
+
+def summary_fields(name, timestamps, distance, starts, stops, **values):
+    """(FieldProfile, BaseType, values) for lap-like messages (called
+    `name`) summing up records [`starts`, `stops`), plus any other field
+    `values`.
+
+    `distance` is as from `reached_distance`, or None to leave it out.
+    """
+    lasts = stops - 1
+    elapsed = timestamps[lasts] - timestamps[starts]
+    totals = {'timestamp': timestamps[lasts],
+              'start_time': timestamps[starts],
+              'total_elapsed_time': elapsed, 'total_timer_time': elapsed}
+    if distance is not None:
+        before = np.where(starts > 0, distance[starts - 1], distance[0])
+        totals['total_distance'] = distance[lasts] - before
+    return message_fields(name, {**totals, **values})
+
+
+def reached_distance(distance):
+    """Distance reached by each record: the last valid value so far (or
+    the first valid value, before it)."""
+    valid = ~np.isnan(distance)
+    if not valid.any():
+        return None
+    latest = np.where(valid, np.arange(len(distance)), np.argmax(valid))
+    return distance[np.maximum.accumulate(latest)]
+
+
+def encode_column(values, base_type, scale=1, offset=0):
+    """Raw FIT values of `values`, with missing values marked invalid."""
+    values = (np.asarray(values, dtype=np.float64) + offset) * scale
+    dtype = np.dtype('<' + base_type.fmt)
+    if dtype.kind == 'f':
+        return values.astype(dtype)   # NaN is invalid anyway
+
+    invalid = base_type.invalid
+    limits = np.iinfo(dtype)
+    raw = np.clip(np.rint(values), limits.min + (invalid == limits.min),
+                  limits.max - (invalid == limits.max))
+    raw[np.isnan(values)] = invalid
+    return raw.astype(dtype)
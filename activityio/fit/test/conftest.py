@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures shared by the fit tests.
+
+"""
+import os
+
+import pytest
+
+
+here = os.path.abspath(os.path.dirname(__file__))
+files = os.path.join(here, 'files')
+
+
+@pytest.fixture
+def fit_files():
+    """Paths of the sample *.fit files."""
+    return [os.path.join(files, fp) for fp in sorted(os.listdir(files))
+            if fp.endswith('.fit')]
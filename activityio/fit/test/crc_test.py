@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import warnings
+
+import pytest
+
+from activityio import fit
+from activityio.fit import _crc
+from activityio._util import exceptions
+
+
+here = os.path.abspath(os.path.dirname(__file__))
+fit_file = os.path.join(here, 'files', 'b4ba3c.fit')
+
+
+def test_crc16():
+    data = os.urandom(3 * _crc.SMALL_BUFFER + 7)   # big enough for numpy
+    want = 0
+    for byte in data:
+        want = _crc.sdk_crc(want, byte)
+    assert _crc.crc16(data) == want
+    assert _crc.crc16(data, 0, 100) == _crc.crc16(data[:100])
+
+
+def test_check_crc():
+    with open(fit_file, 'rb') as f:
+        data = bytearray(f.read())
+
+    fit.read(data, crc='strict')   # shouldn't raise
+
+    data[1000] ^= 0xFF
+    with pytest.raises(exceptions.FITCRCError):
+        fit.read(data, crc='strict')
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        fit.read(data, crc='lenient')
+    assert any(issubclass(w.category, exceptions.FITCRCWarning)
+               for w in caught)
+
+
+def test_truncated_header():
+    with open(fit_file, 'rb') as f:
+        data = f.read()
+    assert data[0] == 14   # the header includes a CRC
+
+    with pytest.raises(exceptions.FITFileHeaderError):
+        fit.read(data[:13], crc='strict')
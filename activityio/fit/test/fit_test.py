@@ -12,6 +12,7 @@ import sys
 import re
 
 import activityio.fit._protocol as fit
+from activityio.fit._profile import MESSAGE_TYPES
 
 
 RE_DIGIT = re.compile(r'\d{1}')
@@ -56,7 +57,7 @@ class FieldValues(collections.UserList):
 
     @mesg.setter
     def mesg(self, value):
-        self.mesg_type = fit.MESSAGE_TYPES.get(value, {})
+        self.mesg_type = MESSAGE_TYPES.get(value, {})
         if self.mesg_type:
             # remap keys to field names
             self.mesg_type = {v['field_name']: v
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check reading through a message index against reading whole files.
+
+"""
+from datetime import timedelta
+import os
+import shutil
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from activityio.fit import _index, _protocol, _reading
+from activityio._util import exceptions
+
+
+def test_index_covers_messages(tmpdir, fit_files):
+    for fp in fit_files:
+        index = _index.build_index(fp)
+        names = [message.name for message in _protocol.gen_fit_messages(fp)]
+        assert [index.names[code] for code in index.name_codes] == names
+
+        saved = str(tmpdir.join('index.npz'))
+        index.save(saved)
+        loaded = _index.MessageIndex.load(saved)
+        assert loaded.names == index.names
+        assert np.array_equal(loaded.offsets, index.offsets)
+        assert np.array_equal(loaded.timestamps, index.timestamps)
+
+
+def test_saving_is_opt_in(tmpdir, fit_files):
+    fp = str(tmpdir.join('activity.fit'))
+    shutil.copy(fit_files[0], fp)
+
+    want = _reading.read_messages(fp, 'session')
+    assert os.listdir(str(tmpdir)) == ['activity.fit']
+
+    assert _reading.read_messages(fp, 'session', save_index=True) == want
+    assert os.path.exists(_index.index_path(fp))
+    assert _reading.read_messages(fp, 'session') == want
+
+
+def test_truncated_file(fit_files):
+    with open(fit_files[0], 'rb') as f:
+        contents = f.read()
+    with pytest.raises(exceptions.FITMessageHeaderError):
+        _index.build_index(contents[:-5])   # part of the last record
+
+
+def test_read_window(fit_files):
+    for fp in fit_files:
+        index = _index.build_index(fp)
+        data = _reading.read_and_format(fp)
+        pd.testing.assert_frame_equal(_reading.read_window(fp, index=index),
+                                      data)
+
+        start = data.start + timedelta(seconds=400)
+        stop = start + timedelta(minutes=5)
+        window = _reading.read_window(fp, start, stop, index=index)
+        assert window.start == start
+        assert len(window) == 300
+
+        times = data.start + data.index
+        want = data[(times >= start) & (times < stop)]
+        assert np.allclose(window['dist'], want['dist'], equal_nan=True)
+
+
+def test_window_accumulated():
+    # Timestamped records packing 12 bits of distance (1/16 m, so rolling
+    # over every 256 m), with one holding the whole distance (in cm).
+    definitions = (bytes([0x40, 0, 0]) + struct.pack('<HB', 20, 2)
+                   + bytes([253, 4, 0x86, 8, 3, 0x0D])
+                   + bytes([0x41, 0, 0]) + struct.pack('<HB', 20, 2)
+                   + bytes([253, 4, 0x86, 5, 4, 0x86]))
+    messages = []
+    for i in range(3000):
+        distance = 10 * i
+        if i == 1500:
+            messages.append(b'\x01' + struct.pack('<2I', 1000 + i,
+                                                   100 * distance))
+        else:
+            messages.append(b'\x00' + struct.pack('<I', 1000 + i) + (
+                1000 | (16*distance & 0xFFF) << 12).to_bytes(3, 'little'))
+    data = definitions + b''.join(messages)
+    contents = (struct.pack('<2BHI4s', 12, 16, 2000, len(data), b'.FIT')
+                + data + b'\x00\x00')
+
+    full = _reading.read_and_format(contents)
+    times = full.start + full.index
+    for seconds in (200, 1000, 2600):   # before, and after the whole value
+        start = full.start + timedelta(seconds=seconds)
+        stop = start + timedelta(minutes=5)
+        window = _reading.read_window(contents, start, stop)
+        want = full[(times >= start) & (times < stop)]
+        assert np.allclose(window['dist'], want['dist'])
+        assert np.allclose(window['dist'], 10 * np.arange(seconds,
+                                                          seconds + 300))
+
+
+def test_read_messages(fit_files):
+    for fp in fit_files:
+        want = [_reading.format_message(message)[1] for message
+                in _protocol.gen_fit_messages(fp, keep={'session'})
+                if isinstance(message, _protocol.DataMessage)]
+        got = _reading.read_messages(fp, 'session',
+                                     index=_index.build_index(fp))
+        assert got == want
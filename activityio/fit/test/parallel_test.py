@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check that decoding in parallel gives the same records as decoding in one go.
+
+"""
+import pandas as pd
+
+from activityio.fit import _parallel, _reading
+
+
+def test_read_parallel(fit_files):
+    for fp in fit_files:
+        with open(fp, 'rb') as reader:
+            contents = reader.read()
+        pd.testing.assert_frame_equal(
+            _parallel.read_parallel(contents, processes=3, min_chunk=10),
+            _reading.read_and_format(fp))
+
+
+def test_serial_fallback(monkeypatch, fit_files):
+    def no_pool(*args, **kwargs):
+        raise AssertionError('started a process pool')
+
+    monkeypatch.setattr(_parallel, 'ProcessPoolExecutor', no_pool)
+    for fp in fit_files:
+        want = _reading.read_and_format(fp)
+        pd.testing.assert_frame_equal(
+            _parallel.read_parallel(fp, processes=1, min_chunk=10), want)
+        pd.testing.assert_frame_equal(   # too little to split
+            _parallel.read_parallel(fp, processes=3), want)
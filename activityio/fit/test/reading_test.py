@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check the columnar reading path against the record-by-record one, and
+decoding of features the sample files don't use (with synthetic files).
+
+"""
+import struct
+
+import numpy as np
+import pandas as pd
+
+from activityio.fit import _index, _protocol, _reading
+from activityio.fit._protocol import MIN_RUN_LENGTH
+
+
+def test_columns_match_records(fit_files):
+    for fp in fit_files:
+        records = pd.DataFrame.from_records(_reading.gen_records(fp))
+        columns, *__ = _reading.read_record_columns(fp)
+
+        assert len(columns) == len(records)
+        for key, values in columns.to_dict().items():
+            if key == 'timestamp_s':
+                continue
+            want = records[key].values
+            if values.dtype == object:
+                assert pd.Series(values).equals(pd.Series(want)), key
+            else:
+                assert np.allclose(values, want, equal_nan=True), key
+
+
+def fit_file(data):
+    """Wrap message `data` in a *.fit file header and (blank) CRC."""
+    header = struct.pack('<2BHI4s', 12, 16, 2000, len(data), b'.FIT')
+    return header + data + b'\x00\x00'
+
+
+def compressed_speed_distance(speed, distance):
+    """Single record definition (local type 0) and data messages packing 12
+    bits of speed (cm/s) then 12 of distance (1/16 m)."""
+    definition = (bytes([0x40, 0, 0]) + struct.pack('<HB', 20, 1)
+                  + bytes([8, 3, 0x0D]))
+    messages = [b'\x00' + ((s & 0xFFF) | (d & 0xFFF) << 12).to_bytes(3,
+                                                                'little')
+                for s, d in zip(speed, distance)]
+    return fit_file(definition + b''.join(messages))
+
+
+def synthetic_fit(time_offsets, start=1000):
+    """A *.fit file with a single full timestamp then compressed ones."""
+    definitions = (bytes([0x40, 0, 0]) + struct.pack('<HB', 20, 2)
+                   + bytes([253, 4, 0x86, 3, 1, 0x02])
+                   + bytes([0x41, 0, 0]) + struct.pack('<HB', 20, 1)
+                   + bytes([3, 1, 0x02]))
+    messages = [b'\x00' + struct.pack('<IB', start, 100)]
+    messages += [bytes([0xA0 | offset, 100]) for offset in time_offsets]
+    return fit_file(definitions + b''.join(messages))
+
+
+def test_compressed_timestamps():
+    offsets = [(1000 + 5*i) & 0x1F for i in range(1, 21)]   # rolls over
+    want = [1000 + 5*i for i in range(21)]
+
+    messages = _protocol.gen_fit_messages(synthetic_fit(offsets))
+    got = [dict((name, value) for name, value, _ in msg.decode())['timestamp']
+           for msg in messages if isinstance(msg, _protocol.DataMessage)]
+    assert got == want
+
+    columns = []
+    for msg in _protocol.gen_fit_messages(synthetic_fit(offsets), runs=True):
+        if isinstance(msg, _protocol.DataMessageRun):
+            columns.extend(dict((name, values) for name, values, _
+                                in msg.decode_columns())['timestamp'])
+        elif isinstance(msg, _protocol.DataMessage):
+            columns.append(dict((name, value) for name, value, _
+                                in msg.decode())['timestamp'])
+    assert columns == want
+
+
+def test_skipping_messages(fit_files):
+    for fp in fit_files:
+        want = [(msg.name, msg.decode())
+                for msg in _protocol.gen_fit_messages(fp)
+                if isinstance(msg, _protocol.DataMessage)
+                and msg.name in ('lap', 'session')]
+        got = [(msg.name, msg.decode()) for msg
+               in _protocol.gen_fit_messages(fp, keep={'lap', 'session'})
+               if isinstance(msg, _protocol.DataMessage)]
+        assert got == want
+
+    # Skipped events (local type 0) still set the time for the compressed
+    # timestamps of records (local type 1).
+    definitions = (bytes([0x40, 0, 0]) + struct.pack('<HB', 21, 1)
+                   + bytes([253, 4, 0x86])
+                   + bytes([0x41, 0, 0]) + struct.pack('<HB', 20, 1)
+                   + bytes([3, 1, 0x02]))
+    messages = [b'\x00' + struct.pack('<I', 1000),
+                bytes([0xA0 | (1003 & 0x1F), 120]),
+                b'\x00' + struct.pack('<I', 2000),
+                bytes([0xA0 | (2010 & 0x1F), 130])]
+    contents = fit_file(definitions + b''.join(messages))
+    timestamps = [dict((name, value) for name, value, _ in msg.decode())
+                  ['timestamp'] for msg
+                  in _protocol.gen_fit_messages(contents, keep={'record'})
+                  if isinstance(msg, _protocol.DataMessage)]
+    assert timestamps == [1003, 2010]
+
+
+def test_subfields():
+    # 'data' of an event depends on its 'event' field.
+    definition = (bytes([0x40, 0, 0]) + struct.pack('<HB', 21, 2)
+                  + bytes([0, 1, 0x00, 3, 4, 0x86]))
+    messages = [b'\x00' + struct.pack('<BI', event, data)
+                for event, data in [(0, 1), (15, 5000), (3, 7)]]
+    decoded = [msg.decode()[1] for msg in _protocol.gen_fit_messages(
+                   fit_file(definition + b''.join(messages)))
+               if isinstance(msg, _protocol.DataMessage)]
+
+    assert decoded == [('timer_trigger', 'auto', ''),   # event 'timer'
+                       ('speed_high_alert', 5.0, 'm/s'),
+                       ('data', 7, '')]   # 'workout' has no subfield
+
+
+def test_components():
+    contents = compressed_speed_distance([1234] * MIN_RUN_LENGTH,
+                                         [800] * MIN_RUN_LENGTH)
+
+    messages = list(_protocol.gen_fit_messages(contents))
+    decoded = {name: value for name, value, _ in messages[-1].decode()}
+    assert decoded['speed'] == 12.34
+    assert decoded['distance'] == 50
+
+    definition, run = _protocol.gen_fit_messages(contents, runs=True)
+    columns = {name: values for name, values, _ in run.decode_columns()}
+    assert np.allclose(columns['speed'], 12.34)
+    assert np.allclose(columns['distance'], 50)
+
+    # Low bytes of 0xFF don't make the whole field invalid.
+    speed = [255, 511] * (MIN_RUN_LENGTH // 2)
+    contents = compressed_speed_distance(speed, [800] * MIN_RUN_LENGTH)
+    messages = list(_protocol.gen_fit_messages(contents))
+    decoded = {name: value for name, value, _ in messages[-1].decode()}
+    assert decoded['speed'] == 5.11
+
+    definition, run = _protocol.gen_fit_messages(contents, runs=True)
+    columns = {name: values for name, values, _ in run.decode_columns()}
+    assert np.allclose(columns['speed'], np.array(speed) / 100)
+    assert np.allclose(columns['distance'], 50)
+
+
+def test_accumulated():
+    distance = np.arange(0, 2000, 100)   # rolls over every 256 m
+    data = _reading.read_and_format(compressed_speed_distance(
+        [1000] * len(distance), (16 * distance).tolist()))
+    assert np.allclose(data['dist'], distance)
+
+
+def test_accumulated_resets():
+    # Local type 1 records hold whole distances (in cm), which the total of
+    # the accumulated ones (local type 0, 1/16 m) carries on from.
+    definitions = (bytes([0x40, 0, 0]) + struct.pack('<HB', 20, 1)
+                   + bytes([8, 3, 0x0D])
+                   + bytes([0x41, 0, 0]) + struct.pack('<HB', 20, 1)
+                   + bytes([5, 4, 0x86]))
+
+    def whole(d):
+        return b'\x01' + struct.pack('<I', 100 * d)
+
+    def wrapped(d):
+        return b'\x00' + (1000 | (16*d & 0xFFF) << 12).to_bytes(3, 'little')
+
+    run = list(range(1100, 2100, 100))
+    distance = [0, 1000] + run + [5000, 5100]
+    messages = ([whole(0), whole(1000)] + [wrapped(d) for d in run]
+                + [whole(5000), wrapped(5100)])
+
+    data = _reading.read_and_format(fit_file(definitions + b''.join(messages)))
+    assert np.allclose(data['dist'], distance)
+
+
+def test_hrv():
+    # Five intervals per message (in ms), the last message partly filled.
+    intervals = np.arange(600, 600 + 5*MIN_RUN_LENGTH + 2)
+    padded = np.full(5 * (MIN_RUN_LENGTH + 1), 0xFFFF)
+    padded[:len(intervals)] = intervals
+
+    definition = (bytes([0x40, 0, 0]) + struct.pack('<HB', 78, 1)
+                  + bytes([0, 10, 0x84]))
+    messages = [b'\x00' + struct.pack('<5H', *chunk)
+                for chunk in padded.reshape(-1, 5).tolist()]
+    data = _reading.read_high_rate(
+        fit_file(definition + b''.join(messages)), 'hrv')
+
+    assert np.allclose(data['time_s'], intervals / 1000)
+    assert np.allclose(data.index.total_seconds(),
+                       np.cumsum(intervals) / 1000)
+
+
+def test_accelerometer():
+    definition = (bytes([0x40, 0, 0]) + struct.pack('<HB', 165, 4)
+                  + bytes([253, 4, 0x86, 0, 2, 0x84, 1, 6, 0x84, 2, 6, 0x84]))
+    messages = [b'\x00' + struct.pack('<IH3H3H', 1000 + i, 500, 0, 10, 20,
+                                      i, i + 1, i + 2)
+                for i in range(3)]
+    data = _reading.read_high_rate(
+        fit_file(definition + b''.join(messages)), 'accelerometer_data')
+
+    assert data['accel_x_counts'].tolist() == [0, 1, 2, 1, 2, 3, 2, 3, 4]
+    seconds = (data.index - data.index[0]).total_seconds()
+    assert np.allclose(seconds, [0, 0.01, 0.02, 1, 1.01, 1.02, 2, 2.01, 2.02])
+    assert list(data) == ['accel_x_counts']
+
+
+def test_developer_fields():
+    description = (
+        bytes([0x40, 0, 0]) + struct.pack('<HB', 206, 5)
+        + bytes([0, 1, 0x02, 1, 1, 0x02, 2, 1, 0x02, 3, 8, 0x07, 8, 6, 0x07])
+        + b'\x00' + bytes([0, 7, 0x84]) + b'Power\x00\x00\x00' + b'watts\x00')
+    definition = (bytes([0x61, 0, 0]) + struct.pack('<HB', 20, 1)
+                  + bytes([253, 4, 0x86]) + bytes([1, 7, 2, 0]))
+    records = [b'\x01' + struct.pack('<IH', 1000 + i, 200 + i)
+               for i in range(2 * MIN_RUN_LENGTH)]
+    contents = fit_file(description + definition + b''.join(records))
+
+    columns, *__ = _reading.read_record_columns(contents)
+    assert columns.get('Power_watts').tolist() == list(range(200, 216))
+    assert [record['Power_watts'] for record
+            in _reading.gen_records(contents)] == list(range(200, 216))
+
+
+def test_chained_files(fit_files):
+    with open(fit_files[0], 'rb') as f:
+        contents = f.read()
+    single, *__ = _reading.read_record_columns(contents)
+    chained, *__ = _reading.read_record_columns(contents + contents)
+    assert len(chained) == 2 * len(single)
+
+    single = _index.build_index(contents)
+    chained = _index.build_index(contents + contents)
+    assert len(chained.offsets) == 2 * len(single.offsets)
+
+
+def test_enum_categoricals():
+    definition = (bytes([0x40, 0, 0]) + struct.pack('<HB', 20, 2)
+                  + bytes([253, 4, 0x86, 42, 1, 0x00]))   # activity_type
+    codes = [1, 2, 0xFF, 200] * MIN_RUN_LENGTH
+    records = [b'\x00' + struct.pack('<IB', 1000 + i, code)
+               for i, code in enumerate(codes)]
+    data = _reading.read_and_format(fit_file(definition + b''.join(records)))
+
+    activity_type = data['activity_type'].values
+    assert list(activity_type.categories[:3]) == ['generic', 'running',
+                                                  'cycling']
+    assert activity_type.categories[-1] == 'unknown_200'
+    assert list(activity_type[:4]) == ['running', 'cycling', np.nan,
+                                       'unknown_200']
+
+
+def test_read_all(fit_files):
+    for fp in fit_files:
+        frames = _reading.read_all(fp)
+        pd.testing.assert_frame_equal(frames['record'],
+                                      _reading.read_and_format(fp))
+
+        for name in ('lap', 'session', 'event'):
+            messages = _reading.read_messages(fp, name)
+            assert len(frames[name]) == len(messages)
+            assert (frames[name]['timestamp'].tolist()
+                    == [message['timestamp'] for message in messages])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check summaries against fully decoded files.
+
+"""
+import struct
+
+from activityio.fit import _reading, _summary
+
+
+def test_read_summary(fit_files):
+    for fp in fit_files:
+        summary = _summary.read_summary(fp)
+        data = _reading.read_and_format(fp)
+
+        assert summary.start == data.start
+        assert summary.end == data.start + data.index[-1]
+        assert summary.sessions == _reading.read_messages(fp, 'session')
+        assert summary.file_id == _reading.read_messages(fp, 'file_id')[0]
+
+
+def test_untimed_records():
+    # Events (local type 0) before and after the records, and a record
+    # (local type 1) without a timestamp before the timestamped ones (2).
+    definitions = b''.join(
+        bytes([0x40 | local_type, 0, 0]) + struct.pack('<HB', number, 1)
+        + bytes(field)
+        for local_type, number, field in [(0, 21, [253, 4, 0x86]),
+                                          (1, 20, [3, 1, 0x02]),
+                                          (2, 20, [253, 4, 0x86])])
+    messages = [b'\x00' + struct.pack('<I', 500), b'\x01' + bytes([120]),
+                b'\x02' + struct.pack('<I', 1000),
+                b'\x02' + struct.pack('<I', 1005),
+                b'\x01' + bytes([130]), b'\x00' + struct.pack('<I', 2000)]
+    data = definitions + b''.join(messages)
+    contents = (struct.pack('<2BHI4s', 12, 16, 2000, len(data), b'.FIT')
+                + data + b'\x00\x00')
+
+    summary = _summary.read_summary(contents)
+    assert summary.start == _summary.fit_datetime(1000)
+    assert summary.end == _summary.fit_datetime(1005)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check that following a growing file gives the same records as reading it
+when it's finished.
+
+"""
+import pandas as pd
+
+from activityio.fit import _reading, _tail
+
+
+def test_tail_reader(tmpdir, fit_files):
+    path = str(tmpdir.join('live.fit'))
+    for fp in fit_files:
+        with open(fp, 'rb') as reader:
+            contents = reader.read()
+        writing = bytearray(contents)
+        writing[4:8] = bytes(4)   # data size isn't known until the end
+
+        tail = _tail.TailReader(path)
+        chunks = []
+        for stop in (5, 14, 100, 20001, 20002, len(contents) - 2):
+            with open(path, 'wb') as writer:
+                writer.write(writing[:stop])
+            chunks.append(tail.read())
+        with open(path, 'wb') as writer:
+            writer.write(contents)
+        chunks.append(tail.read())
+
+        assert len(chunks[0]) == 0
+        assert len(chunks[-1]) == 0
+        pd.testing.assert_frame_equal(pd.concat(chunks),
+                                      _reading.read_and_format(fp))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check that written files read back as the data they were written from.
+
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from activityio.fit import _reading, _writing
+from activityio.fit._profile import TYPES_INFO
+
+
+def test_round_trip(tmpdir, fit_files):
+    path = str(tmpdir.join('written.fit'))
+    for fp in fit_files:
+        data = _reading.read_and_format(fp, tz_str='Europe/London')
+        _writing.write(data, path, tz_str='Europe/London')
+
+        written = _reading.read_and_format(path, tz_str='Europe/London',
+                                           crc='strict')
+        assert written.start == data.start
+        pd.testing.assert_frame_equal(written, data, check_like=True)
+
+
+def test_enum_columns(tmpdir, fit_files):
+    path = str(tmpdir.join('written.fit'))
+    data = _reading.read_and_format(fit_files[0])
+    codes = np.resize([1, 2, 200, np.nan], len(data))   # 200 isn't named
+    data['activity_type'] = _reading.enum_categorical(
+        codes, TYPES_INFO['activity_type'])
+    _writing.write(data, path)
+
+    written = _reading.read_and_format(path, crc='strict')
+    assert list(written['activity_type'].cat.categories[-1:]) == [
+        'unknown_200']
+    pd.testing.assert_frame_equal(written, data, check_like=True)
+
+    data['hr'] = data['hr'].astype('category')   # not an enum field
+    with pytest.raises(ValueError):
+        _writing.write(data, path)
+
+
+def test_summary_messages(tmpdir, fit_files):
+    path = str(tmpdir.join('written.fit'))
+    for fp in fit_files:
+        data = _reading.read_and_format(fp)
+        _writing.write(data, path)
+
+        elapsed = (data.index[-1] - data.index[0]).total_seconds()
+        distance = data['dist'].iloc[-1] - data['dist'].iloc[0]
+        session, = _reading.read_messages(path, 'session')
+        assert session['num_laps'] == data['lap'].nunique()
+        assert session['total_elapsed_time_s'] == pytest.approx(elapsed)
+        assert session['total_distance_m'] == pytest.approx(distance,
+                                                            abs=0.01)
+
+        laps = _reading.read_messages(path, 'lap')
+        assert len(laps) == data['lap'].nunique()
+        assert sum(lap['total_distance_m'] for lap in laps) == pytest.approx(
+            distance, abs=0.01 * len(laps))
+
+        activity, = _reading.read_messages(path, 'activity')
+        assert activity['num_sessions'] == 1
+        assert activity['total_timer_time_s'] == pytest.approx(elapsed)
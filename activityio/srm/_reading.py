@@ -8,6 +8,7 @@ from struct import unpack, calcsize
 
 from activityio._types import ActivityData, special_columns
 from activityio._util import drydoc, exceptions
+from activityio._util.sources import open_source
 
 
 DATETIME_1880 = datetime(year=1880, month=1, day=1)
@@ -180,18 +181,27 @@ class SRMChunk:
             yield name, getattr(self, name)
 
 
-@contextmanager
-def open_srm(file_path):
-    reader = open(file_path, 'rb')
+class SRMFile:
+    """A binary file object, and the version of the SRM file it holds."""
+    __slots__ = ('reader', 'version')
+
+    def __init__(self, reader):
+        magic = reader.read(4)
+        if magic[:3] != b'SRM':
+            raise exceptions.InvalidFileError('srm')
 
-    magic = reader.read(4).decode('utf-8')
-    if magic[:3] != 'SRM':
-        raise exceptions.InvalidFileError('srm')
-    reader.version = int(magic[-1])
+        self.reader = reader
+        self.version = int(magic[3:].decode('utf-8'))
 
-    yield reader
+    def read(self, size):
+        return self.reader.read(size)
 
-    reader.close()
+
+@contextmanager
+def open_srm(source):
+    """`source` can be a path, the file contents or a binary file object."""
+    with open_source(source) as reader:
+        yield SRMFile(reader)
 
 
 @drydoc.gen_records
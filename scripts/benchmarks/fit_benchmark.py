@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time the stages of FIT file reading.
+
+Usage: python fit_benchmark.py [file.fit ...]
+
+Defaults to the files used by the test suite.
+"""
+from glob import glob
+from os import path
+import sys
+from timeit import repeat
+
+from activityio import fit
+from activityio.fit import _crc
+
+
+here = path.abspath(path.dirname(__file__))
+TEST_FILES = path.join(here, '../../activityio/fit/test/files/*.fit')
+
+
+def best_of(func, number=10):
+    return min(repeat(func, number=number, repeat=3)) / number
+
+
+def report(name, seconds):
+    print('  {:<20} {:>10.3f} ms'.format(name, seconds * 1e3))
+
+
+def main(file_paths):
+    for file_path in file_paths:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        print('%s (%d bytes)' % (path.basename(file_path), len(data)))
+        report('crc16', best_of(lambda: _crc.crc16(data)))
+        report('fit.read', best_of(lambda: fit.read(data)))
+        report('fit.read (strict)',
+               best_of(lambda: fit.read(data, crc='strict')))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or sorted(glob(TEST_FILES)))
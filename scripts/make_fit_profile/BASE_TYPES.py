@@ -6,11 +6,14 @@ This module was generated automatically.
 I sincerely apologise for it looking so disgusting.
 
 """
-from math import isnan
+from collections.abc import Mapping
+from math import nan
+from os import path
+import pickle
 import struct
 
 class BaseType:
-    __slots__ = ('name', 'identifier', 'fmt', 'parse')
+    __slots__ = ('name', 'identifier', 'fmt', 'invalid')
 
     def __init__(self, **kwargs):
         for name, value in kwargs.items():
@@ -25,24 +28,111 @@ class BaseType:
         return self.identifier & 0x1F
 
 
-BASE_TYPE_BYTE = BaseType(name='byte', identifier=0x0D, fmt='B', parse=lambda x: None if x == 0xFF else x)
+BASE_TYPE_BYTE = BaseType(name='byte', identifier=0x0D, fmt='B', invalid=0xFF)
 
-# Decide how invalid values are to be handled with the `parse` attribute.
+# Missing values are marked with the `invalid` value of their base type
+# (strings are invalid when empty).
 BASE_TYPES = {
-    0x00: BaseType(name='enum',    identifier=0x00, fmt='B', parse=lambda x: None if x == 0xFF else x),
-    0x01: BaseType(name='sint8',   identifier=0x01, fmt='b', parse=lambda x: None if x == 0x7F else x),
-    0x02: BaseType(name='uint8',   identifier=0x02, fmt='B', parse=lambda x: None if x == 0xFF else x),
-    0x83: BaseType(name='sint16',  identifier=0x83, fmt='h', parse=lambda x: None if x == 0x7FFF else x),
-    0x84: BaseType(name='uint16',  identifier=0x84, fmt='H', parse=lambda x: None if x == 0xFFFF else x),
-    0x85: BaseType(name='sint32',  identifier=0x85, fmt='i', parse=lambda x: None if x == 0x7FFFFFFF else x),
-    0x86: BaseType(name='uint32',  identifier=0x86, fmt='I', parse=lambda x: None if x == 0xFFFFFFFF else x),
-    0x07: BaseType(name='string',  identifier=0x07, fmt='s', parse=lambda x: x.split(b'\x00')[0] or None),
-    0x88: BaseType(name='float32', identifier=0x88, fmt='f', parse=lambda x: None if isnan(x) else x),
-    0x89: BaseType(name='float64', identifier=0x89, fmt='d', parse=lambda x: None if isnan(x) else x),
-    0x0A: BaseType(name='uint8z',  identifier=0x0A, fmt='B', parse=lambda x: None if x == 0x0 else x),
-    0x8B: BaseType(name='uint16z', identifier=0x8B, fmt='H', parse=lambda x: None if x == 0x0 else x),
-    0x8C: BaseType(name='uint32z', identifier=0x8C, fmt='I', parse=lambda x: None if x == 0x0 else x),
+    0x00: BaseType(name='enum',    identifier=0x00, fmt='B', invalid=0xFF),
+    0x01: BaseType(name='sint8',   identifier=0x01, fmt='b', invalid=0x7F),
+    0x02: BaseType(name='uint8',   identifier=0x02, fmt='B', invalid=0xFF),
+    0x83: BaseType(name='sint16',  identifier=0x83, fmt='h', invalid=0x7FFF),
+    0x84: BaseType(name='uint16',  identifier=0x84, fmt='H', invalid=0xFFFF),
+    0x85: BaseType(name='sint32',  identifier=0x85, fmt='i', invalid=0x7FFFFFFF),
+    0x86: BaseType(name='uint32',  identifier=0x86, fmt='I', invalid=0xFFFFFFFF),
+    0x07: BaseType(name='string',  identifier=0x07, fmt='s', invalid=b''),
+    0x88: BaseType(name='float32', identifier=0x88, fmt='f', invalid=nan),
+    0x89: BaseType(name='float64', identifier=0x89, fmt='d', invalid=nan),
+    0x0A: BaseType(name='uint8z',  identifier=0x0A, fmt='B', invalid=0x0),
+    0x8B: BaseType(name='uint16z', identifier=0x8B, fmt='H', invalid=0x0),
+    0x8C: BaseType(name='uint32z', identifier=0x8C, fmt='I', invalid=0x0),
+    0x8E: BaseType(name='sint64',  identifier=0x8E, fmt='q', invalid=0x7FFFFFFFFFFFFFFF),
+    0x8F: BaseType(name='uint64',  identifier=0x8F, fmt='Q', invalid=0xFFFFFFFFFFFFFFFF),
+    0x90: BaseType(name='uint64z', identifier=0x90, fmt='Q', invalid=0x0),
     0x0D: BASE_TYPE_BYTE}
 
 BASE_TYPES_BY_NAME = {bt.name: bt for bt in BASE_TYPES.values()}
 
+
+
+# The bulk of the profile is kept in a pickle alongside this module, with
+# each message type (and each type) pickled separately. These are only
+# unpickled the first time they're looked up.
+PROFILE_DATA_PATH = path.join(path.dirname(path.abspath(__file__)),
+                              '_profile.pickle')
+
+
+class ProfileTable(Mapping):
+    __slots__ = ('_blobs', '_build', '_cache')
+
+    def __init__(self, blobs, build=None):
+        self._blobs = blobs   # pickled values, by key
+        self._build = build   # optionally applied to unpickled values
+        self._cache = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = pickle.loads(self._blobs[key])
+            if self._build is not None:
+                value = self._build(value)
+            self._cache[key] = value
+            return value
+
+    def __contains__(self, key):
+        return key in self._blobs
+
+    def __iter__(self):
+        return iter(self._blobs)
+
+    def __len__(self):
+        return len(self._blobs)
+
+
+def read_tables():
+    with open(PROFILE_DATA_PATH, 'rb') as data:
+        return pickle.load(data)
+
+
+class FieldProfile:
+    """Everything needed to decode a field (or subfield), flattened out of
+    the profile by make_profile.py so no dict lookups are needed later."""
+    __slots__ = ('number', 'name', 'type', 'units', 'scale', 'offset',
+                 'is_array', 'enum', 'components', 'subfields',
+                 'ref_field_name', 'ref_field_values')
+
+    def __init__(self, number, name, type, units, scale, offset, is_array,
+                 enum_name, components, subfields, ref_field_name,
+                 ref_field_values):
+        self.number, self.name, self.type = number, name, type
+        self.units, self.scale, self.offset = units, scale, offset
+        self.is_array = is_array
+        self.enum = TYPES_INFO[enum_name] if enum_name is not None else None
+        self.components = tuple(ComponentProfile(*component)
+                                for component in components)
+        self.subfields = tuple(FieldProfile(*subfield)
+                               for subfield in subfields)
+        self.ref_field_name = ref_field_name
+        self.ref_field_values = ref_field_values
+
+    @property
+    def is_dynamic(self):
+        return bool(self.subfields)
+
+
+class ComponentProfile:
+    __slots__ = ('name', 'bits', 'scale', 'offset', 'units', 'accumulate')
+
+    def __init__(self, name, bits, scale, offset, units, accumulate):
+        self.name, self.bits, self.units = name, bits, units
+        self.scale, self.offset = scale, offset
+        self.accumulate = accumulate
+
+
+def build_fields(records):
+    return {number: FieldProfile(*record) for number, record in records.items()}
+
+
+UNKNOWN_FIELD = FieldProfile(None, 'unknown', None, '', 1, 0, False, None,
+                             (), (), None, frozenset())
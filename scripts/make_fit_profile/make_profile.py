@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 from operator import itemgetter
 from os import path
+import pickle
 from pprint import pformat
 
 import xlrd
@@ -11,6 +12,8 @@ here = path.abspath(path.dirname(__file__))
 
 PROFILE_XLSX_PATH = path.join(here, 'Profile.xlsx')
 
+PICKLE_PROTOCOL = 4   # python 3.4+
+
 WORKBOOK = xlrd.open_workbook(PROFILE_XLSX_PATH)
 
 COLNAMES_TYPES = ('type_name', 'base_type', 'value_name',
@@ -218,32 +221,118 @@ types_sheet = read_types_sheet()
 messages_sheet = read_messages_sheet()
 
 
+def split_list(value):
+    """Profile cells can hold comma separated lists (for components)."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return [value]
+
+
+def flatten_components(field_data):
+    """(name, bits, scale, offset, units, accumulate) for each component."""
+    if 'components' not in field_data:
+        return ()
+
+    names = split_list(field_data['components'])
+
+    def column(key, default):
+        values = split_list(field_data.get(key, default)) or [default]
+        return values * len(names) if len(values) == 1 else values
+
+    return tuple(zip(
+        names,
+        (int(float(bits)) for bits in column('bits', 0)),
+        (float(scale) for scale in column('scale', 1)),
+        (float(offset) for offset in column('offset', 0)),
+        column('units', ''),
+        (bool(int(float(acc))) for acc in column('accumulate', 0)),
+    ))
+
+
+def flatten_field(field_data, type_names, number=None):
+    """A flat record of everything needed to decode a field (or subfield).
+
+    Where a field has several components, the scale, offset and units
+    belong to those components rather than the field itself.
+    """
+    name = field_data['field_name']
+
+    scale = field_data.get('scale', 1)
+    offset = field_data.get('offset', 0)
+    units = field_data.get('units', '')
+    if isinstance(scale, str):
+        scale = 1
+    if isinstance(offset, str):
+        offset = 0
+    if ',' in units:
+        units = ''
+
+    subfields = tuple(flatten_field(subfield, type_names)
+                      for subfield in field_data.get('subfields', {}).values())
+
+    return (
+        number, name, field_data.get('field_type'), units, scale, offset,
+        'array' in field_data,
+        name if name in type_names else None,   # enum lookups are by name
+        flatten_components(field_data),
+        subfields,
+        field_data.get('ref_field_name'),
+        frozenset(field_data.get('ref_field_value', ())),
+    )
+
+
+def flatten_fields(message, type_names):
+    return {int(number): flatten_field(field_data, type_names, int(number))
+            for number, field_data in message.items()}
+
+
+def pickle_each(table):
+    """Pickle the values of a table separately, so they can be loaded
+    on demand."""
+    return {key: pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+            for key, value in table.items()}
+
+
 if __name__ == '__main__':
 
     # We're going to write a module...
     lines = []
 
-    # Use pretty print, but format the first part manually.
-    lines.append('MESSAGE_TYPES = {{\n {!s}'.format(
-        pformat(messages_sheet, indent=4)[1:]))
-
-    types_sheet_sans_basetype = {key: value['values']
-                                 for key, value in types_sheet.items()}
-    lines.append('TYPES_INFO = {{\n {!s}'.format(
-        pformat(types_sheet_sans_basetype, indent=4)[1:]))
+    lines.append("_TABLES = read_tables()\n\n"
+                 "MESSAGE_TYPES = ProfileTable(_TABLES['MESSAGE_TYPES'])\n"
+                 "TYPES_INFO = ProfileTable(_TABLES['TYPES_INFO'])\n"
+                 "MESSAGE_FIELDS = ProfileTable(_TABLES['MESSAGE_FIELDS'], "
+                 "build_fields)")
 
+    # Use pretty print, but format the first part manually.
     lines.append('GLOBAL_MESG_NUMS = {{\n {!s}'.format(
         pformat(types_sheet['mesg_num']['values'], indent=4)[1:]))
 
     code = '\n\n'.join(lines)
     code += '\n'  # trailing new line
 
-    outfile = path.abspath(path.join(
-        here, '../../activityio/fit', '_profile.py'))
+    # ...and the data it loads.
+    types_sheet_sans_basetype = {key: value['values']
+                                 for key, value in types_sheet.items()}
+    tables = {
+        'MESSAGE_TYPES': pickle_each(messages_sheet),
+        'TYPES_INFO': pickle_each(types_sheet_sans_basetype),
+        'MESSAGE_FIELDS': pickle_each({
+            name: flatten_fields(message, types_sheet)
+            for name, message in messages_sheet.items()}),
+    }
+
+    outdir = path.abspath(path.join(here, '../../activityio/fit'))
+    outfile = path.join(outdir, '_profile.py')
+    datafile = path.join(outdir, '_profile.pickle')
     basetypes_file = path.join(here, 'BASE_TYPES.py')
 
     with open(outfile, 'wt', encoding='utf-8') as out, \
          open(basetypes_file, 'rt', encoding='utf-8') as basetypes:
 
         out.writelines(basetypes)
+        out.write('\n\n')
         out.write(code)
+
+    with open(datafile, 'wb') as data:
+        pickle.dump(tables, data, protocol=PICKLE_PROTOCOL)
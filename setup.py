@@ -30,10 +30,14 @@ setup(
         'Intended Audience :: Science/Research',
         'Topic :: Scientific/Engineering :: Medical Science Apps.',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.6',
     ],
 
+    python_requires='>=3.6',
     packages=find_packages(),
+    package_data={
+        'activityio.fit': ['_profile.pickle'],
+    },
     install_requires=[
         'numpy>=1.11.1',
         'pandas>=0.18.1',